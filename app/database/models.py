@@ -5,8 +5,12 @@ Defines User, Flight, Booking, and FareHistory tables with relationships.
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Enum
+from sqlalchemy import (
+    Column, String, Integer, SmallInteger, Float, DateTime, ForeignKey, Index, Uuid,
+    CheckConstraint
+)
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator
 import enum
 
 from app.database.connection import Base
@@ -17,7 +21,30 @@ def generate_uuid():
     return str(uuid.uuid4())
 
 
-class BookingStatus(enum.Enum):
+class GUID(TypeDecorator):
+    """
+    UUID primary/foreign key type.
+
+    Stored as a native 16-byte uuid on PostgreSQL (CHAR(32) elsewhere) while
+    ids remain plain strings in Python. Strings that are not valid UUIDs bind
+    as the nil UUID, so lookups with them simply match no rows.
+    """
+    impl = Uuid
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        try:
+            return uuid.UUID(value)
+        except ValueError:
+            return uuid.UUID(int=0)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else str(value)
+
+
+class BookingStatus(str, enum.Enum):
     """Enum for booking status values."""
     PENDING = "PENDING"           # Seat selected, awaiting passenger info
     INFO_ADDED = "INFO_ADDED"     # Passenger info added, awaiting payment
@@ -25,6 +52,39 @@ class BookingStatus(enum.Enum):
     CANCELLED = "CANCELLED"       # Booking cancelled
     FAILED = "FAILED"             # Payment failed
 
+    def __str__(self):
+        return self.value
+
+
+# Compact on-disk codes for BookingStatus (never renumber existing values)
+BOOKING_STATUS_CODES = {
+    BookingStatus.PENDING: 1,
+    BookingStatus.INFO_ADDED: 2,
+    BookingStatus.CONFIRMED: 3,
+    BookingStatus.CANCELLED: 4,
+    BookingStatus.FAILED: 5,
+}
+_STATUSES_BY_CODE = {code: status for status, code in BOOKING_STATUS_CODES.items()}
+
+
+class BookingStatusType(TypeDecorator):
+    """
+    BookingStatus column stored as a SMALLINT code.
+
+    Python code and the API keep working with the string enum; only the
+    database sees the integer, which keeps rows and status indexes small.
+    Existing VARCHAR columns are converted by
+    migrations/002_booking_status_codes.sql.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else BOOKING_STATUS_CODES[BookingStatus(value)]
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else _STATUSES_BY_CODE[value]
+
 
 class User(Base):
     """
@@ -32,7 +92,7 @@ class User(Base):
     """
     __tablename__ = "users"
 
-    id = Column(String, primary_key=True, default=generate_uuid)
+    id = Column(GUID, primary_key=True, default=generate_uuid)
     name = Column(String(100), nullable=False)
     email = Column(String(100), unique=True, nullable=False, index=True)
     mobile_no = Column(String(15), nullable=True)
@@ -54,7 +114,7 @@ class Flight(Base):
     """
     __tablename__ = "flights"
 
-    id = Column(String, primary_key=True, default=generate_uuid)
+    id = Column(GUID, primary_key=True, default=generate_uuid)
     flight_number = Column(String(10), unique=True, nullable=False)
     airline = Column(String(50), nullable=False)
     source = Column(String(50), nullable=False, index=True)
@@ -81,15 +141,15 @@ class Booking(Base):
     """
     __tablename__ = "bookings"
 
-    id = Column(String, primary_key=True, default=generate_uuid)
+    id = Column(GUID, primary_key=True, default=generate_uuid)
     pnr = Column(String(6), unique=True, nullable=True, index=True)  # Generated after confirmation
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
-    flight_id = Column(String, ForeignKey("flights.id"), nullable=False)
+    user_id = Column(GUID, ForeignKey("users.id"), nullable=False)
+    flight_id = Column(GUID, ForeignKey("flights.id"), nullable=False)
     seat_no = Column(String(5), nullable=False)  # e.g., "12A", "15B"
     passenger_name = Column(String(100), nullable=True)
     passenger_email = Column(String(100), nullable=True)
     final_price = Column(Float, nullable=True)  # Price at time of booking
-    status = Column(String(20), default=BookingStatus.PENDING.value)
+    status = Column(BookingStatusType, nullable=False, default=BookingStatus.PENDING)
     booking_date = Column(DateTime, nullable=True)  # Set on confirmation
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -98,6 +158,34 @@ class Booking(Base):
     user = relationship("User", back_populates="bookings")
     flight = relationship("Flight", back_populates="bookings")
 
+    __table_args__ = (
+        CheckConstraint(
+            f"status IN ({', '.join(str(code) for code in BOOKING_STATUS_CODES.values())})",
+            name="ck_booking_status_code",
+        ),
+        # Admin listings filter by status and order by newest first
+        Index("ix_booking_status_created", status, created_at.desc()),
+        # Seat availability checks filter by flight and status
+        Index("ix_booking_flight_status", flight_id, status),
+        # Confirmed bookings per flight (partial index where supported)
+        Index(
+            "ix_booking_confirmed",
+            flight_id,
+            postgresql_where=(status == BookingStatus.CONFIRMED),
+            sqlite_where=(status == BookingStatus.CONFIRMED),
+        ),
+        # A seat can be held by at most one live booking per flight; the
+        # database rejects double booking, so no pre-check query is needed
+        Index(
+            "ix_active_seat",
+            flight_id,
+            seat_no,
+            unique=True,
+            postgresql_where=status.notin_([BookingStatus.CANCELLED, BookingStatus.FAILED]),
+            sqlite_where=status.notin_([BookingStatus.CANCELLED, BookingStatus.FAILED]),
+        ),
+    )
+
     def __repr__(self):
         return f"<Booking(id={self.id}, pnr={self.pnr}, status={self.status})>"
 
@@ -110,7 +198,7 @@ class FareHistory(Base):
     __tablename__ = "fare_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    flight_id = Column(String, ForeignKey("flights.id"), nullable=False)
+    flight_id = Column(GUID, ForeignKey("flights.id"), nullable=False)
     price = Column(Float, nullable=False)
     demand_factor = Column(Float, nullable=False)
     available_seats = Column(Integer, nullable=False)
@@ -119,5 +207,10 @@ class FareHistory(Base):
     # Relationship
     flight = relationship("Flight", back_populates="fare_history")
 
+    __table_args__ = (
+        # Price history is read per flight, newest first
+        Index("ix_fare_history_flight_recorded", flight_id, recorded_at),
+    )
+
     def __repr__(self):
         return f"<FareHistory(flight_id={self.flight_id}, price={self.price})>"
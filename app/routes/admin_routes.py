@@ -2,21 +2,61 @@
 Admin Routes - Endpoints for admin management of flights, bookings, and users.
 """
 
-from typing import List, Optional
+from threading import Lock
+from typing import FrozenSet, List, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select, insert, update, func, case
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 from pydantic import BaseModel
 
 from app.database.connection import get_db
 from app.database.models import User, Flight, Booking, BookingStatus
-from app.utils.auth import get_current_user
+from app.utils.auth import get_current_user, invalidate_user
 from app.schemas.booking import BookingResponse
-from app.services.booking_service import _booking_to_response
+from app.services.booking_service import _booking_to_response, invalidate_booking_history
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate_desc, finish_page
+)
 
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
+# Booking status values accepted by the admin override (in declaration order for messages)
+_STATUS_CHOICES: List[str] = [s.value for s in BookingStatus]
+_VALID_STATUSES: FrozenSet[str] = frozenset(_STATUS_CHOICES)
+
+# Dashboard stats tolerate a few seconds of staleness; concurrent admins share
+# one cached result and the lock ensures only one request rebuilds it
+STATS_CACHE_TTL_SECONDS = 10
+_stats_cache: TTLCache = TTLCache(maxsize=1, ttl=STATS_CACHE_TTL_SECONDS)
+_stats_lock = Lock()
+
+# Columns read by the admin listings; selecting them directly skips ORM hydration
+_ADMIN_USER_COLUMNS = (
+    User.id,
+    User.name,
+    User.email,
+    User.mobile_no,
+    func.coalesce(User.is_admin, 0).label("is_admin"),
+    User.created_at,
+)
+_ADMIN_FLIGHT_COLUMNS = (
+    Flight.id,
+    Flight.flight_number,
+    Flight.airline,
+    Flight.source,
+    Flight.destination,
+    Flight.departure_time,
+    Flight.arrival_time,
+    Flight.base_price,
+    Flight.total_seats,
+    Flight.available_seats,
+    Flight.demand_factor,
+)
+
 
 # Pydantic models for admin operations
 class AdminStats(BaseModel):
@@ -65,8 +105,16 @@ class BookingAdminUpdate(BaseModel):
 
 
 # Admin middleware
-def require_admin(current_user: User = Depends(get_current_user)):
-    if not current_user.is_admin:
+def require_admin(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    # The user itself may come from a worker-local cache; read the admin flag
+    # from the database so a revocation applies in every worker at once
+    is_admin = db.execute(
+        select(User.is_admin).where(User.id == current_user.id)
+    ).scalar_one_or_none()
+    if not is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
@@ -77,50 +125,61 @@ def require_admin(current_user: User = Depends(get_current_user)):
 # Dashboard Stats
 @router.get("/stats", response_model=AdminStats)
 def get_admin_stats(db: Session = Depends(get_db), admin: User = Depends(require_admin)):
-    """Get dashboard statistics for admin."""
-    total_users = db.query(User).count()
-    total_flights = db.query(Flight).count()
-    total_bookings = db.query(Booking).count()
-    confirmed_bookings = db.query(Booking).filter(
-        Booking.status == BookingStatus.CONFIRMED.value
-    ).count()
-    pending_bookings = db.query(Booking).filter(
-        Booking.status.in_([BookingStatus.PENDING.value, BookingStatus.INFO_ADDED.value])
-    ).count()
+    """Get dashboard statistics for admin (cached for STATS_CACHE_TTL_SECONDS)."""
+    with _stats_lock:
+        stats = _stats_cache.get("stats")
+        if stats is None:
+            stats = _stats_cache["stats"] = _compute_admin_stats(db)
+    return stats
+
+
+def _compute_admin_stats(db: Session) -> AdminStats:
+    """Aggregate dashboard statistics from the database."""
+    is_confirmed = Booking.status == BookingStatus.CONFIRMED
+    is_pending = Booking.status.in_([BookingStatus.PENDING, BookingStatus.INFO_ADDED])
     
-    # Calculate revenue
-    revenue_result = db.query(Booking).filter(
-        Booking.status == BookingStatus.CONFIRMED.value
-    ).all()
-    total_revenue = sum(b.final_price or 0 for b in revenue_result)
+    # Single round-trip: one pass over bookings with conditional aggregates,
+    # plus scalar subqueries for the user and flight totals
+    stats = db.execute(
+        select(
+            select(func.count()).select_from(User).scalar_subquery().label("total_users"),
+            select(func.count()).select_from(Flight).scalar_subquery().label("total_flights"),
+            func.count(Booking.id).label("total_bookings"),
+            func.count(case((is_confirmed, 1))).label("confirmed_bookings"),
+            func.count(case((is_pending, 1))).label("pending_bookings"),
+            func.coalesce(
+                func.sum(case((is_confirmed, Booking.final_price))), 0
+            ).label("total_revenue"),
+        ).select_from(Booking)
+    ).one()
     
     return AdminStats(
-        total_users=total_users,
-        total_flights=total_flights,
-        total_bookings=total_bookings,
-        confirmed_bookings=confirmed_bookings,
-        total_revenue=total_revenue,
-        pending_bookings=pending_bookings
+        total_users=stats.total_users,
+        total_flights=stats.total_flights,
+        total_bookings=stats.total_bookings,
+        confirmed_bookings=stats.confirmed_bookings,
+        total_revenue=stats.total_revenue,
+        pending_bookings=stats.pending_bookings
     )
 
 
 # User Management
 @router.get("/users", response_model=List[UserResponse])
-def get_all_users(db: Session = Depends(get_db), admin: User = Depends(require_admin)):
-    """Get all users with their booking counts."""
-    users = db.query(User).order_by(User.created_at.desc()).all()
-    return [
-        UserResponse(
-            id=u.id,
-            name=u.name,
-            email=u.email,
-            mobile_no=u.mobile_no,
-            is_admin=u.is_admin or 0,
-            created_at=u.created_at,
-            booking_count=len(u.bookings)
-        )
-        for u in users
-    ]
+def get_all_users(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin)
+):
+    """Get users (newest first, keyset-paginated) with their booking counts."""
+    # Count bookings in the same query instead of lazy-loading u.bookings per user
+    query = db.query(
+        *_ADMIN_USER_COLUMNS, func.count(Booking.id).label("booking_count")
+    ).outerjoin(Booking, Booking.user_id == User.id).group_by(User.id)
+    rows = paginate_desc(query, User.created_at, User.id, cursor, limit).all()
+    rows = finish_page(rows, limit, response, lambda row: (row.created_at, row.id))
+    return [dict(row._mapping) for row in rows]
 
 
 @router.put("/users/{user_id}/toggle-admin")
@@ -130,40 +189,59 @@ def toggle_admin_status(
     admin: User = Depends(require_admin)
 ):
     """Toggle admin status for a user."""
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    if user.id == admin.id:
+    if user_id == admin.id:
         raise HTTPException(status_code=400, detail="Cannot modify your own admin status")
     
-    user.is_admin = 0 if user.is_admin else 1
+    # Flip the flag atomically in one UPDATE ... RETURNING (no read-then-write race)
+    toggled = db.execute(
+        update(User).where(User.id == user_id, User.id != admin.id).values(
+            is_admin=1 - func.coalesce(User.is_admin, 0)
+        ).returning(User.is_admin, User.email).execution_options(synchronize_session=False)
+    ).first()
+    if not toggled:
+        raise HTTPException(status_code=404, detail="User not found")
+    
     db.commit()
+    invalidate_user(user_id)
     
-    return {"message": f"Admin status {'granted' if user.is_admin else 'revoked'} for {user.email}"}
+    return {"message": f"Admin status {'granted' if toggled.is_admin else 'revoked'} for {toggled.email}"}
 
 
 # Booking Management
-@router.get("/bookings", response_model=List[BookingResponse])
+# Rows are built from trusted ORM data, so skip response validation and keep
+# the schema only for the API docs
+@router.get(
+    "/bookings",
+    response_model=None,
+    responses={200: {"model": List[BookingResponse]}}
+)
 def get_all_bookings(
+    response: Response,
     status_filter: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin)
 ):
-    """Get all bookings with optional status filter."""
-    query = db.query(Booking).order_by(Booking.created_at.desc())
+    """Get bookings (newest first, keyset-paginated) with optional status filter."""
+    # Batch-load the flights rendered by _booking_to_response (one IN query per page)
+    query = db.query(Booking).options(selectinload(Booking.flight))
     
     if status_filter:
-        query = query.filter(Booking.status == status_filter.upper())
+        status_filter = status_filter.upper()
+        if status_filter not in _VALID_STATUSES:
+            raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {_STATUS_CHOICES}")
+        query = query.filter(Booking.status == status_filter)
     
-    bookings = query.all()
-    return [_booking_to_response(b) for b in bookings]
+    bookings = paginate_desc(query, Booking.created_at, Booking.id, cursor, limit).all()
+    bookings = finish_page(bookings, limit, response, lambda b: (b.created_at, b.id))
+    return [_booking_to_response(b).model_dump() for b in bookings]
 
 
 @router.put("/bookings/{booking_id}/status")
 def update_booking_status(
     booking_id: str,
-    update: BookingAdminUpdate,
+    status_update: BookingAdminUpdate,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin)
 ):
@@ -172,40 +250,46 @@ def update_booking_status(
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
     
-    valid_statuses = [s.value for s in BookingStatus]
-    if update.status and update.status.upper() not in valid_statuses:
-        raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {valid_statuses}")
+    new_status = status_update.status and status_update.status.upper()
+    if new_status and new_status not in _VALID_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {_STATUS_CHOICES}")
     
-    if update.status:
-        booking.status = update.status.upper()
+    if new_status:
+        booking.status = BookingStatus(new_status)
     
-    db.commit()
+    seat_no = booking.seat_no
+    try:
+        db.commit()
+    except IntegrityError:
+        # Reactivating a cancelled/failed booking whose seat was since taken
+        # violates the one-active-booking-per-seat index
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Seat {seat_no} is held by another booking."
+        )
+    invalidate_booking_history(booking.user_id)
     
     return {"message": f"Booking {booking_id} updated to status {booking.status}"}
 
 
 # Flight Management
 @router.get("/flights")
-def get_all_flights_admin(db: Session = Depends(get_db), admin: User = Depends(require_admin)):
-    """Get all flights for admin management."""
-    flights = db.query(Flight).order_by(Flight.departure_time.desc()).all()
-    return [
-        {
-            "id": f.id,
-            "flight_number": f.flight_number,
-            "airline": f.airline,
-            "source": f.source,
-            "destination": f.destination,
-            "departure_time": f.departure_time,
-            "arrival_time": f.arrival_time,
-            "base_price": f.base_price,
-            "total_seats": f.total_seats,
-            "available_seats": f.available_seats,
-            "demand_factor": f.demand_factor,
-            "bookings_count": len(f.bookings)
-        }
-        for f in flights
-    ]
+def get_all_flights_admin(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin)
+):
+    """Get flights for admin management (latest departure first, keyset-paginated)."""
+    # Count bookings in the same query instead of lazy-loading f.bookings per flight
+    query = db.query(
+        *_ADMIN_FLIGHT_COLUMNS, func.count(Booking.id).label("bookings_count")
+    ).outerjoin(Booking, Booking.flight_id == Flight.id).group_by(Flight.id)
+    rows = paginate_desc(query, Flight.departure_time, Flight.id, cursor, limit).all()
+    rows = finish_page(rows, limit, response, lambda row: (row.departure_time, row.id))
+    return [dict(row._mapping) for row in rows]
 
 
 @router.post("/flights")
@@ -220,45 +304,51 @@ def create_flight(
     if existing:
         raise HTTPException(status_code=400, detail="Flight number already exists")
     
-    flight = Flight(
-        flight_number=flight_data.flight_number,
-        airline=flight_data.airline,
-        source=flight_data.source,
-        destination=flight_data.destination,
-        departure_time=flight_data.departure_time,
-        arrival_time=flight_data.arrival_time,
-        base_price=flight_data.base_price,
-        total_seats=flight_data.total_seats,
-        available_seats=flight_data.total_seats,
-        demand_factor=1.0
-    )
-    
-    db.add(flight)
+    # INSERT ... RETURNING hands back the generated id in the same round-trip
+    flight_id = db.execute(
+        insert(Flight).values(
+            flight_number=flight_data.flight_number,
+            airline=flight_data.airline,
+            source=flight_data.source,
+            destination=flight_data.destination,
+            departure_time=flight_data.departure_time,
+            arrival_time=flight_data.arrival_time,
+            base_price=flight_data.base_price,
+            total_seats=flight_data.total_seats,
+            available_seats=flight_data.total_seats,
+            demand_factor=1.0
+        ).returning(Flight.id)
+    ).scalar_one()
     db.commit()
-    db.refresh(flight)
     
-    return {"message": "Flight created successfully", "flight_id": flight.id}
+    return {"message": "Flight created successfully", "flight_id": flight_id}
 
 
 @router.put("/flights/{flight_id}")
 def update_flight(
     flight_id: str,
-    update: FlightUpdate,
+    flight_update: FlightUpdate,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin)
 ):
     """Update flight details."""
-    flight = db.query(Flight).filter(Flight.id == flight_id).first()
-    if not flight:
-        raise HTTPException(status_code=404, detail="Flight not found")
+    update_data = flight_update.model_dump(exclude_none=True)
     
-    update_data = update.dict(exclude_none=True)
-    for key, value in update_data.items():
-        setattr(flight, key, value)
+    if update_data:
+        # Patch in one UPDATE ... RETURNING without loading the flight first
+        stmt = update(Flight).where(Flight.id == flight_id).values(
+            **update_data
+        ).returning(Flight.flight_number).execution_options(synchronize_session=False)
+    else:
+        stmt = select(Flight.flight_number).where(Flight.id == flight_id)
+    
+    flight_number = db.execute(stmt).scalar_one_or_none()
+    if flight_number is None:
+        raise HTTPException(status_code=404, detail="Flight not found")
     
     db.commit()
     
-    return {"message": f"Flight {flight.flight_number} updated successfully"}
+    return {"message": f"Flight {flight_number} updated successfully"}
 
 
 @router.delete("/flights/{flight_id}")
@@ -272,7 +362,10 @@ def delete_flight(
     if not flight:
         raise HTTPException(status_code=404, detail="Flight not found")
     
-    if flight.bookings:
+    has_bookings = db.query(
+        db.query(Booking.id).filter(Booking.flight_id == flight_id).exists()
+    ).scalar()
+    if has_bookings:
         raise HTTPException(
             status_code=400,
             detail="Cannot delete flight with existing bookings"
@@ -2,7 +2,7 @@
 Booking Routes - API endpoints for the multi-step booking flow.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.database.connection import get_db
@@ -96,11 +96,10 @@ def get_booking_history(
     
     Returns bookings ordered by creation date (newest first).
     """
-    bookings = booking_service.get_user_bookings(db, current_user)
-    
-    return BookingHistoryResponse(
-        bookings=bookings,
-        total_count=len(bookings)
+    # Pre-serialized (and briefly cached) JSON, returned without re-encoding
+    return Response(
+        content=booking_service.get_user_booking_history_json(db, current_user),
+        media_type="application/json"
     )
 
 
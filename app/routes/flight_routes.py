@@ -14,6 +14,7 @@ from app.schemas.flight import (
 )
 from app.services import flight_service
 from app.services.pricing_engine import get_pricing_breakdown
+from app.utils.responses import ORJSONResponse
 
 router = APIRouter(prefix="/api/flights", tags=["Flights"])
 
@@ -25,6 +26,8 @@ def search_flights(
     departure_date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format"),
     min_price: Optional[float] = Query(None, ge=0, description="Minimum price filter"),
     max_price: Optional[float] = Query(None, ge=0, description="Maximum price filter"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of flights to return"),
+    offset: int = Query(0, ge=0, description="Number of matching flights to skip"),
     db: Session = Depends(get_db)
 ):
     """
@@ -35,22 +38,27 @@ def search_flights(
     - **departure_date**: Filter by departure date
     - **min_price**: Filter by minimum base price
     - **max_price**: Filter by maximum base price
+    - **limit** / **offset**: Page through results (at most 200 per page)
     
-    Returns list of flights with dynamic pricing applied.
+    Returns a page of flights with dynamic pricing applied and the total
+    number of matching flights.
     """
-    flights = flight_service.search_flights(
+    flights, total_count = flight_service.search_flights(
         db,
         source=source,
         destination=destination,
         departure_date=departure_date,
         min_price=min_price,
-        max_price=max_price
+        max_price=max_price,
+        limit=limit,
+        offset=offset
     )
     
-    return FlightListResponse(
-        flights=flights,
-        total_count=len(flights)
-    )
+    # Service returns plain dicts built from database rows; serialize them directly
+    return ORJSONResponse({
+        "flights": flights,
+        "total_count": total_count
+    })
 
 
 @router.get("/{flight_id}", response_model=FlightDetailResponse)
@@ -77,7 +85,7 @@ def get_flight_details(
     return flight_details
 
 
-@router.get("/{flight_id}/seats", response_model=dict)
+@router.get("/{flight_id}/seats")
 def get_available_seats(
     flight_id: str,
     db: Session = Depends(get_db)
@@ -99,9 +107,7 @@ def get_available_seats(
             detail="Flight not found"
         )
     
-    booked_seats = flight_service.get_booked_seats(db, flight_id)
-    all_seats = flight_service.generate_seat_numbers(flight.total_seats)
-    available_seats = [seat for seat in all_seats if seat not in booked_seats]
+    available_seats, booked_seats = flight_service.get_seat_availability(db, flight)
     
     return {
         "flight_id": flight_id,
@@ -142,7 +148,7 @@ def get_price_history(
     )
 
 
-@router.get("/{flight_id}/pricing", response_model=dict)
+@router.get("/{flight_id}/pricing")
 def get_pricing_details(
     flight_id: str,
     db: Session = Depends(get_db)
@@ -5,22 +5,18 @@ Supports multi-step booking flow.
 
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from app.schemas.examples import add_example
 
 
 # Step 1: Seat Selection
 class SeatSelectionRequest(BaseModel):
     """Schema for initiating a booking with seat selection."""
     flight_id: str = Field(..., description="ID of the flight to book")
-    seat_no: str = Field(..., description="Seat number to reserve (e.g., '12A')")
+    seat_no: str = Field(..., max_length=5, description="Seat number to reserve (e.g., '12A')")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "flight_id": "abc123-def456",
-                "seat_no": "12A"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=add_example)
 
 
 class SeatSelectionResponse(BaseModel):
@@ -39,13 +35,7 @@ class PassengerInfoRequest(BaseModel):
     passenger_name: str = Field(..., min_length=2, max_length=100, description="Passenger's full name")
     passenger_email: EmailStr = Field(..., description="Passenger's email for confirmation")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "passenger_name": "John Doe",
-                "passenger_email": "john.doe@example.com"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=add_example)
 
 
 class PassengerInfoResponse(BaseModel):
@@ -65,15 +55,7 @@ class PaymentRequest(BaseModel):
     expiry_year: int = Field(..., ge=2024, description="Card expiry year")
     cvv: str = Field(..., min_length=3, max_length=4, description="CVV code")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "card_number": "4111111111111111",
-                "expiry_month": 12,
-                "expiry_year": 2025,
-                "cvv": "123"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=add_example)
 
 
 class PaymentResponse(BaseModel):
@@ -96,6 +78,8 @@ class BookingFlightInfo(BaseModel):
     departure_time: datetime
     arrival_time: datetime
 
+    model_config = ConfigDict(frozen=True)
+
 
 class BookingResponse(BaseModel):
     """Complete booking details."""
@@ -112,8 +96,7 @@ class BookingResponse(BaseModel):
     created_at: datetime
     flight: Optional[BookingFlightInfo] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class BookingHistoryResponse(BaseModel):
@@ -121,6 +104,8 @@ class BookingHistoryResponse(BaseModel):
     bookings: List[BookingResponse]
     total_count: int
 
+    model_config = ConfigDict(defer_build=True)
+
 
 # Cancellation
 class CancellationResponse(BaseModel):
@@ -0,0 +1,45 @@
+"""
+Example payloads for the OpenAPI docs, keyed by schema class name.
+
+Schemas reference add_example as their json_schema_extra, so an example is
+only attached when the JSON schema is actually generated (i.e. when /docs
+or /openapi.json is requested), not when the models are imported.
+"""
+
+from typing import Any, Dict, Type
+
+EXAMPLES: Dict[str, Dict[str, Any]] = {
+    # Booking
+    "SeatSelectionRequest": {
+        "flight_id": "abc123-def456",
+        "seat_no": "12A"
+    },
+    "PassengerInfoRequest": {
+        "passenger_name": "John Doe",
+        "passenger_email": "john.doe@example.com"
+    },
+    "PaymentRequest": {
+        "card_number": "4111111111111111",
+        "expiry_month": 12,
+        "expiry_year": 2025,
+        "cvv": "123"
+    },
+    # User
+    "UserCreate": {
+        "name": "John Doe",
+        "email": "john.doe@example.com",
+        "mobile_no": "+1234567890",
+        "password": "securepassword123"
+    },
+    "UserLogin": {
+        "email": "john.doe@example.com",
+        "password": "securepassword123"
+    },
+}
+
+
+def add_example(schema: Dict[str, Any], model: Type) -> None:
+    """json_schema_extra hook: attach the model's example, if one is registered."""
+    example = EXAMPLES.get(model.__name__)
+    if example is not None:
+        schema["example"] = example
@@ -1,10 +1,13 @@
 """
 Pydantic schemas for Flight-related request and response models.
+
+List-bearing response models use defer_build=True: their core schema is
+built on first use instead of at import time.
 """
 
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class FlightSearchRequest(BaseModel):
@@ -14,6 +17,8 @@ class FlightSearchRequest(BaseModel):
     departure_date: Optional[str] = Field(None, description="Departure date (YYYY-MM-DD)")
     min_price: Optional[float] = Field(None, ge=0, description="Minimum price filter")
     max_price: Optional[float] = Field(None, ge=0, description="Maximum price filter")
+    limit: int = Field(50, ge=1, le=200, description="Maximum number of flights to return")
+    offset: int = Field(0, ge=0, description="Number of matching flights to skip")
 
 
 class FlightResponse(BaseModel):
@@ -31,14 +36,15 @@ class FlightResponse(BaseModel):
     available_seats: int
     duration_minutes: int  # Calculated field
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class FlightListResponse(BaseModel):
     """Schema for list of flights response."""
     flights: List[FlightResponse]
-    total_count: int
+    total_count: int  # All matching flights, not just this page
+
+    model_config = ConfigDict(defer_build=True)
 
 
 class SeatInfo(BaseModel):
@@ -47,6 +53,8 @@ class SeatInfo(BaseModel):
     is_available: bool
     seat_type: str  # WINDOW, MIDDLE, AISLE
 
+    model_config = ConfigDict(frozen=True)
+
 
 class FlightDetailResponse(BaseModel):
     """Schema for detailed flight information including seats."""
@@ -63,8 +71,7 @@ class FlightDetailResponse(BaseModel):
     available_seats: int
     available_seat_list: List[str]  # List of available seat numbers
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class FareHistoryItem(BaseModel):
@@ -74,8 +81,7 @@ class FareHistoryItem(BaseModel):
     available_seats: int
     recorded_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class FareHistoryResponse(BaseModel):
@@ -83,3 +89,5 @@ class FareHistoryResponse(BaseModel):
     flight_id: str
     flight_number: str
     history: List[FareHistoryItem]
+
+    model_config = ConfigDict(defer_build=True)
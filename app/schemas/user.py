@@ -4,7 +4,9 @@ Pydantic schemas for User-related request and response models.
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from app.schemas.examples import add_example
 
 
 class UserCreate(BaseModel):
@@ -14,15 +16,7 @@ class UserCreate(BaseModel):
     mobile_no: Optional[str] = Field(None, max_length=15, description="User's mobile number")
     password: str = Field(..., min_length=6, description="User's password")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "John Doe",
-                "email": "john.doe@example.com",
-                "mobile_no": "+1234567890",
-                "password": "securepassword123"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=add_example)
 
 
 class UserLogin(BaseModel):
@@ -30,13 +24,7 @@ class UserLogin(BaseModel):
     email: EmailStr = Field(..., description="User's email address")
     password: str = Field(..., description="User's password")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "email": "john.doe@example.com",
-                "password": "securepassword123"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=add_example)
 
 
 class UserResponse(BaseModel):
@@ -48,8 +36,7 @@ class UserResponse(BaseModel):
     is_admin: int = 0
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class TokenResponse(BaseModel):
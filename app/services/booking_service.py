@@ -9,8 +9,13 @@ Booking Flow:
 """
 
 from datetime import datetime
+from itertools import count
+from threading import Lock
 from typing import List, Optional
-from sqlalchemy.orm import Session
+import orjson
+from cachetools import TTLCache
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 import random
@@ -24,9 +29,31 @@ from app.schemas.booking import (
     CancellationResponse
 )
 from app.services.pricing_engine import calculate_dynamic_price
-from app.services.flight_service import get_booked_seats
+from app.services.flight_service import bulk_release_seats
 from app.utils.pnr_generator import generate_pnr
 
+# Probability that a simulated payment succeeds. The simulation uses the
+# non-cryptographic `random` module on purpose: it only decides a mock outcome.
+_PAYMENT_SUCCESS_RATE = 0.9
+
+# Attempts to confirm a booking before giving up on PNR collisions
+_PNR_COMMIT_ATTEMPTS = 3
+
+# Seat columns A-F as bits 0-5 (see _is_valid_seat)
+_SEAT_COLUMN_MASK = 0b111111
+
+# Serialized booking history per user. Every booking mutation invalidates the
+# owner's entry; the TTL bounds staleness from writes in other processes.
+HISTORY_CACHE_TTL_SECONDS = 5
+_history_cache: TTLCache = TTLCache(maxsize=10_000, ttl=HISTORY_CACHE_TTL_SECONDS)
+_history_lock = Lock()
+
+# Generation per user, set to a fresh value on every invalidation. A history
+# built while its owner's generation changed may predate the write, so it is
+# returned but not cached. Entries outlive any in-flight build by far.
+_history_generations: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_history_generation_counter = count(1)
+
 
 def initiate_booking(
     db: Session,
@@ -35,7 +62,8 @@ def initiate_booking(
 ) -> SeatSelectionResponse:
     """
     Step 1: Initiate booking by selecting a seat.
-    Uses database transaction to prevent double booking.
+    Double booking is prevented by the ix_active_seat unique index: a taken
+    seat makes the insert fail with IntegrityError, mapped to HTTP 409.
     
     Args:
         db: Database session
@@ -50,8 +78,10 @@ def initiate_booking(
     """
     # Start transaction
     try:
-        # Get flight with row lock (FOR UPDATE equivalent in SQLite)
-        flight = db.query(Flight).filter(Flight.id == request.flight_id).first()
+        # Lock the flight row so concurrent bookings serialize on available_seats
+        flight = db.execute(
+            select(Flight).where(Flight.id == request.flight_id).with_for_update()
+        ).scalar_one_or_none()
         
         if not flight:
             raise HTTPException(
@@ -60,7 +90,8 @@ def initiate_booking(
             )
         
         # Check if flight has departed
-        if flight.departure_time <= datetime.now():
+        now = datetime.now()
+        if flight.departure_time <= now:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot book a flight that has already departed"
@@ -73,14 +104,6 @@ def initiate_booking(
                 detail="No seats available on this flight"
             )
         
-        # Check if seat is already booked
-        booked_seats = get_booked_seats(db, request.flight_id)
-        if request.seat_no in booked_seats:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Seat {request.seat_no} is already booked"
-            )
-        
         # Validate seat number format
         if not _is_valid_seat(request.seat_no, flight.total_seats):
             raise HTTPException(
@@ -92,23 +115,24 @@ def initiate_booking(
         existing_pending = db.query(Booking).filter(
             Booking.user_id == user.id,
             Booking.flight_id == request.flight_id,
-            Booking.status == BookingStatus.PENDING.value
+            Booking.status == BookingStatus.PENDING
         ).first()
         
         if existing_pending:
-            # Cancel the old pending booking
-            existing_pending.status = BookingStatus.CANCELLED.value
+            # Cancel the old pending booking (flushed before the insert, so
+            # re-selecting the same seat does not trip the unique index)
+            existing_pending.status = BookingStatus.CANCELLED
         
         # Calculate current dynamic price
-        dynamic_price = calculate_dynamic_price(flight)
+        dynamic_price = calculate_dynamic_price(flight, now)
         
         # Create pending booking
         booking = Booking(
             user_id=user.id,
             flight_id=request.flight_id,
-            seat_no=request.seat_no,
+            seat_no=request.seat_no.upper(),  # One spelling per seat for ix_active_seat
             final_price=dynamic_price,
-            status=BookingStatus.PENDING.value
+            status=BookingStatus.PENDING
         )
         
         db.add(booking)
@@ -117,7 +141,7 @@ def initiate_booking(
         flight.available_seats -= 1
         
         db.commit()
-        db.refresh(booking)
+        invalidate_booking_history(user.id)
         
         return SeatSelectionResponse(
             booking_id=booking.id,
@@ -125,14 +149,14 @@ def initiate_booking(
             seat_no=booking.seat_no,
             status=booking.status,
             dynamic_price=dynamic_price,
-            message=f"Seat {request.seat_no} reserved. Please complete booking within 15 minutes."
+            message=f"Seat {booking.seat_no} reserved. Please complete booking within 15 minutes."
         )
     
     except IntegrityError:
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail="Seat was just booked by another user. Please select a different seat."
+            detail=f"Seat {request.seat_no} is already booked. Please select a different seat."
         )
 
 
@@ -156,7 +180,7 @@ def add_passenger_info(
     """
     booking = _get_user_booking(db, user.id, booking_id)
     
-    if booking.status != BookingStatus.PENDING.value:
+    if booking.status != BookingStatus.PENDING:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Cannot add passenger info. Booking status is: {booking.status}"
@@ -165,10 +189,10 @@ def add_passenger_info(
     # Update booking with passenger info
     booking.passenger_name = request.passenger_name
     booking.passenger_email = request.passenger_email
-    booking.status = BookingStatus.INFO_ADDED.value
+    booking.status = BookingStatus.INFO_ADDED
     
     db.commit()
-    db.refresh(booking)
+    invalidate_booking_history(user.id)
     
     return PassengerInfoResponse(
         booking_id=booking.id,
@@ -203,33 +227,29 @@ def process_payment(
     """
     booking = _get_user_booking(db, user.id, booking_id)
     
-    if booking.status not in [BookingStatus.PENDING.value, BookingStatus.INFO_ADDED.value]:
+    if booking.status not in [BookingStatus.PENDING, BookingStatus.INFO_ADDED]:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Cannot process payment. Booking status is: {booking.status}"
         )
     
+    # One timestamp for the card expiry check and the booking date
+    now = datetime.now()
+    
     # Validate payment details (basic validation)
-    if not _validate_card(request):
+    if not _validate_card(request, now):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid card details"
         )
     
     # Simulate payment processing (90% success rate)
-    payment_success = random.random() < 0.9
+    payment_success = random.random() < _PAYMENT_SUCCESS_RATE
     
     if payment_success:
-        # Generate unique PNR
-        pnr = generate_pnr(db)
-        
-        # Confirm booking
-        booking.pnr = pnr
-        booking.status = BookingStatus.CONFIRMED.value
-        booking.booking_date = datetime.now()
-        
-        db.commit()
-        db.refresh(booking)
+        # Confirm booking with a fresh PNR (unique constraint enforced on commit)
+        pnr = _confirm_with_pnr(db, booking, now)
+        invalidate_booking_history(user.id)
         
         return PaymentResponse(
             booking_id=booking.id,
@@ -241,14 +261,12 @@ def process_payment(
         )
     else:
         # Payment failed - release the seat
-        flight = db.query(Flight).filter(Flight.id == booking.flight_id).first()
-        if flight:
-            flight.available_seats += 1
+        bulk_release_seats(db, [(booking.flight_id, 1)])
         
-        booking.status = BookingStatus.FAILED.value
+        booking.status = BookingStatus.FAILED
         
         db.commit()
-        db.refresh(booking)
+        invalidate_booking_history(user.id)
         
         return PaymentResponse(
             booking_id=booking.id,
@@ -262,13 +280,15 @@ def process_payment(
 
 def get_booking_by_id(db: Session, user: User, booking_id: str) -> BookingResponse:
     """Get booking details by ID."""
-    booking = _get_user_booking(db, user.id, booking_id)
+    booking = _get_user_booking(db, user.id, booking_id, load_flight=True)
     return _booking_to_response(booking)
 
 
 def get_booking_by_pnr(db: Session, pnr: str) -> Optional[BookingResponse]:
     """Get booking details by PNR (public lookup)."""
-    booking = db.query(Booking).filter(Booking.pnr == pnr.upper()).first()
+    booking = db.query(Booking).options(joinedload(Booking.flight)).filter(
+        Booking.pnr == pnr.upper()
+    ).first()
     
     if not booking:
         return None
@@ -277,14 +297,47 @@ def get_booking_by_pnr(db: Session, pnr: str) -> Optional[BookingResponse]:
 
 
 def get_user_bookings(db: Session, user: User) -> List[BookingResponse]:
-    """Get all bookings for a user."""
-    bookings = db.query(Booking).filter(
+    """Get all bookings for a user (flights joined in the same query)."""
+    bookings = db.query(Booking).options(joinedload(Booking.flight)).filter(
         Booking.user_id == user.id
     ).order_by(Booking.created_at.desc()).all()
     
     return [_booking_to_response(b) for b in bookings]
 
 
+def get_user_booking_history_json(db: Session, user: User) -> bytes:
+    """
+    Get the user's booking history as serialized JSON bytes.
+    
+    Served from a short-lived per-user cache; on a miss the history is
+    built with get_user_bookings and serialized once with orjson.
+    """
+    with _history_lock:
+        cached = _history_cache.get(user.id)
+        generation = _history_generations.get(user.id, 0)
+    if cached is not None:
+        return cached
+    
+    bookings = get_user_bookings(db, user)
+    payload = orjson.dumps({
+        "bookings": [b.model_dump() for b in bookings],
+        "total_count": len(bookings)
+    })
+    
+    with _history_lock:
+        # Skip caching if a booking changed while this payload was built
+        if _history_generations.get(user.id, 0) == generation:
+            _history_cache[user.id] = payload
+    return payload
+
+
+def invalidate_booking_history(user_id: str) -> None:
+    """Drop a user's cached booking history after one of their bookings changes."""
+    with _history_lock:
+        _history_cache.pop(user_id, None)
+        _history_generations[user_id] = next(_history_generation_counter)
+
+
 def cancel_booking(db: Session, user: User, booking_id: str) -> CancellationResponse:
     """
     Cancel a booking.
@@ -294,33 +347,32 @@ def cancel_booking(db: Session, user: User, booking_id: str) -> CancellationResp
     """
     booking = _get_user_booking(db, user.id, booking_id)
     
-    if booking.status == BookingStatus.CANCELLED.value:
+    if booking.status == BookingStatus.CANCELLED:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Booking is already cancelled"
         )
     
-    if booking.status == BookingStatus.FAILED.value:
+    if booking.status == BookingStatus.FAILED:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot cancel a failed booking"
         )
     
     # Release the seat
-    flight = db.query(Flight).filter(Flight.id == booking.flight_id).first()
-    if flight and booking.status in [BookingStatus.PENDING.value, BookingStatus.INFO_ADDED.value, BookingStatus.CONFIRMED.value]:
-        flight.available_seats += 1
+    if booking.status in [BookingStatus.PENDING, BookingStatus.INFO_ADDED, BookingStatus.CONFIRMED]:
+        bulk_release_seats(db, [(booking.flight_id, 1)])
     
     # Calculate refund (if confirmed booking)
     refund_amount = None
-    if booking.status == BookingStatus.CONFIRMED.value and booking.final_price:
+    if booking.status == BookingStatus.CONFIRMED and booking.final_price:
         # 80% refund for cancellations
         refund_amount = round(booking.final_price * 0.8, 2)
     
-    booking.status = BookingStatus.CANCELLED.value
+    booking.status = BookingStatus.CANCELLED
     
     db.commit()
-    db.refresh(booking)
+    invalidate_booking_history(user.id)
     
     return CancellationResponse(
         booking_id=booking.id,
@@ -333,12 +385,25 @@ def cancel_booking(db: Session, user: User, booking_id: str) -> CancellationResp
 
 # Helper functions
 
-def _get_user_booking(db: Session, user_id: str, booking_id: str) -> Booking:
-    """Get a booking belonging to a specific user."""
-    booking = db.query(Booking).filter(
+def _get_user_booking(
+    db: Session,
+    user_id: str,
+    booking_id: str,
+    load_flight: bool = False
+) -> Booking:
+    """
+    Get a booking belonging to a specific user.
+    Pass load_flight=True when the flight will be rendered, to join it in.
+    """
+    # Cached lambda statements: built once per shape, re-bound per call
+    stmt = lambda_stmt(lambda: select(Booking).where(
         Booking.id == booking_id,
         Booking.user_id == user_id
-    ).first()
+    ))
+    if load_flight:
+        stmt += lambda s: s.options(joinedload(Booking.flight))
+    
+    booking = db.execute(stmt).scalars().first()
     
     if not booking:
         raise HTTPException(
@@ -349,24 +414,64 @@ def _get_user_booking(db: Session, user_id: str, booking_id: str) -> Booking:
     return booking
 
 
+def _confirm_with_pnr(db: Session, booking: Booking, booking_date: datetime) -> str:
+    """
+    Confirm a booking under a newly generated PNR and commit.
+    
+    PNRs are not pre-checked; a collision with an existing PNR fails the
+    commit on the unique index, and the confirmation is retried with a new
+    code (bounded by _PNR_COMMIT_ATTEMPTS).
+    
+    Returns:
+        The PNR assigned to the booking
+    """
+    for _ in range(_PNR_COMMIT_ATTEMPTS):
+        pnr = generate_pnr()
+        booking.pnr = pnr
+        booking.status = BookingStatus.CONFIRMED
+        booking.booking_date = booking_date
+        try:
+            db.commit()
+            return pnr
+        except IntegrityError:
+            # Rollback reloads the booking's committed state for the next attempt
+            db.rollback()
+    
+    raise HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Could not allocate a PNR. Please retry the payment."
+    )
+
+
 def _is_valid_seat(seat_no: str, total_seats: int) -> bool:
-    """Validate seat number format and range."""
+    """
+    Validate seat number format and range.
+    
+    The row must be plain ASCII digits without a leading zero, so each seat
+    has exactly one spelling ("1A", never "01A") for the unique seat index.
+    """
     if not seat_no or len(seat_no) < 2:
         return False
     
-    try:
-        row = int(seat_no[:-1])
-        col = seat_no[-1].upper()
-        
-        max_rows = (total_seats + 5) // 6
-        
-        return row >= 1 and row <= max_rows and col in 'ABCDEF'
-    except ValueError:
+    # Column letter -> bit index, case-insensitively ('A'/'a' -> 0 ... 'F'/'f' -> 5)
+    col_index = (ord(seat_no[-1]) | 0x20) - ord('a')
+    if not 0 <= col_index < 6 or not (1 << col_index) & _SEAT_COLUMN_MASK:
+        return False
+    
+    row_part = seat_no[:-1]
+    if not (row_part.isascii() and row_part.isdigit()) or row_part[0] == '0':
+        return False
+    
+    # Longer than any valid row: reject before int() (which also refuses
+    # strings past Python's integer conversion digit limit)
+    max_rows = (total_seats + 5) // 6
+    if len(row_part) > len(str(max_rows)):
         return False
+    return int(row_part) <= max_rows
 
 
-def _validate_card(request: PaymentRequest) -> bool:
-    """Basic card validation (simulated)."""
+def _validate_card(request: PaymentRequest, now: Optional[datetime] = None) -> bool:
+    """Basic card validation (simulated). `now` defaults to the current time."""
     # Check card number length
     if len(request.card_number) != 16:
         return False
@@ -376,8 +481,9 @@ def _validate_card(request: PaymentRequest) -> bool:
         return False
     
     # Check expiry
-    current_year = datetime.now().year
-    current_month = datetime.now().month
+    now = now or datetime.now()
+    current_year = now.year
+    current_month = now.month
     
     if request.expiry_year < current_year:
         return False
@@ -388,10 +494,13 @@ def _validate_card(request: PaymentRequest) -> bool:
 
 
 def _booking_to_response(booking: Booking) -> BookingResponse:
-    """Convert Booking model to BookingResponse schema."""
+    """
+    Convert Booking model to BookingResponse schema.
+    Rows come from the database, so the schemas are built without validation.
+    """
     flight_info = None
     if booking.flight:
-        flight_info = BookingFlightInfo(
+        flight_info = BookingFlightInfo.model_construct(
             flight_number=booking.flight.flight_number,
             airline=booking.flight.airline,
             source=booking.flight.source,
@@ -400,7 +509,7 @@ def _booking_to_response(booking: Booking) -> BookingResponse:
             arrival_time=booking.flight.arrival_time
         )
     
-    return BookingResponse(
+    return BookingResponse.model_construct(
         id=booking.id,
         pnr=booking.pnr,
         user_id=booking.user_id,
@@ -409,7 +518,7 @@ def _booking_to_response(booking: Booking) -> BookingResponse:
         passenger_name=booking.passenger_name,
         passenger_email=booking.passenger_email,
         final_price=booking.final_price,
-        status=booking.status,
+        status=booking.status.value,
         booking_date=booking.booking_date,
         created_at=booking.created_at,
         flight=flight_info
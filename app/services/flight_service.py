@@ -3,13 +3,35 @@ Flight Service - Handles flight search, details, and availability.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional
+from functools import lru_cache
+from itertools import product
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, case, func, lambda_stmt, select, update
 
 from app.database.models import Flight, Booking, FareHistory, BookingStatus
-from app.schemas.flight import FlightResponse, FlightDetailResponse, FareHistoryItem
-from app.services.pricing_engine import calculate_dynamic_price
+from app.schemas.flight import FlightDetailResponse, FareHistoryItem
+from app.services.pricing_engine import calculate_dynamic_price, calculate_dynamic_prices
+
+# Bookings that still hold their seat (a fixed SQL expression, so cached
+# lambda statements can embed it as-is)
+_SEAT_HELD = Booking.status.notin_([BookingStatus.CANCELLED, BookingStatus.FAILED])
+
+# Columns read by flight listings; selecting them directly returns plain rows
+# and skips ORM object materialization and identity-map bookkeeping
+_FLIGHT_COLS = (
+    Flight.id,
+    Flight.flight_number,
+    Flight.airline,
+    Flight.source,
+    Flight.destination,
+    Flight.departure_time,
+    Flight.arrival_time,
+    Flight.base_price,
+    Flight.total_seats,
+    Flight.available_seats,
+    Flight.demand_factor,
+)
 
 
 def search_flights(
@@ -18,10 +40,12 @@ def search_flights(
     destination: Optional[str] = None,
     departure_date: Optional[str] = None,
     min_price: Optional[float] = None,
-    max_price: Optional[float] = None
-) -> List[FlightResponse]:
+    max_price: Optional[float] = None,
+    limit: int = 50,
+    offset: int = 0
+) -> Tuple[List[dict], int]:
     """
-    Search for flights with optional filters.
+    Search for flights with optional filters, one page at a time.
     
     Args:
         db: Database session
@@ -30,11 +54,16 @@ def search_flights(
         departure_date: Filter by date (YYYY-MM-DD)
         min_price: Minimum base price filter
         max_price: Maximum base price filter
+        limit: Page size
+        offset: Number of matching flights to skip
     
     Returns:
-        List of FlightResponse objects with dynamic pricing
+        (FlightResponse-shaped dicts with dynamic pricing, total matching count)
     """
-    query = db.query(Flight)
+    # Single timestamp for every time-based filter in this query
+    now = datetime.now()
+    
+    query = select(*_FLIGHT_COLS)
     
     # Apply filters
     if source:
@@ -64,17 +93,29 @@ def search_flights(
     
     # Only show future flights with available seats
     query = query.filter(
-        Flight.departure_time > datetime.now(),
+        Flight.departure_time > now,
         Flight.available_seats > 0
     )
     
-    # Order by departure time
-    query = query.order_by(Flight.departure_time)
+    # Order by departure time (id breaks ties so pages are stable)
+    rows = db.execute(
+        query.order_by(Flight.departure_time, Flight.id).limit(limit).offset(offset)
+    ).all()
     
-    flights = query.all()
+    # A short first page is the whole result; otherwise count in the database
+    if offset == 0 and len(rows) < limit:
+        total_count = len(rows)
+    else:
+        total_count = db.execute(
+            select(func.count()).select_from(query.subquery())
+        ).scalar_one()
     
-    # Convert to response with dynamic pricing
-    return [_flight_to_response(flight) for flight in flights]
+    # Price the whole result set in one vectorized pass
+    prices = calculate_dynamic_prices(rows, now)
+    
+    # Convert to response dicts with dynamic pricing
+    flights = [_row_to_flight_dict(row, price) for row, price in zip(rows, prices)]
+    return flights, total_count
 
 
 def get_flight_by_id(db: Session, flight_id: str) -> Optional[Flight]:
@@ -97,12 +138,7 @@ def get_flight_details(db: Session, flight_id: str) -> Optional[FlightDetailResp
     if not flight:
         return None
     
-    # Get booked seats for this flight
-    booked_seats = get_booked_seats(db, flight_id)
-    
-    # Generate all possible seats and filter out booked ones
-    all_seats = generate_seat_numbers(flight.total_seats)
-    available_seats = [seat for seat in all_seats if seat not in booked_seats]
+    available_seats, _ = get_seat_availability(db, flight)
     
     duration = int((flight.arrival_time - flight.departure_time).total_seconds() / 60)
     
@@ -124,12 +160,70 @@ def get_flight_details(db: Session, flight_id: str) -> Optional[FlightDetailResp
 
 def get_booked_seats(db: Session, flight_id: str) -> List[str]:
     """Get list of already booked seat numbers for a flight."""
-    bookings = db.query(Booking).filter(
-        Booking.flight_id == flight_id,
-        Booking.status.notin_([BookingStatus.CANCELLED.value, BookingStatus.FAILED.value])
-    ).all()
+    # lambda_stmt builds and caches the statement once; later calls only
+    # re-bind flight_id
+    stmt = lambda_stmt(lambda: select(Booking.seat_no).where(
+        Booking.flight_id == flight_id, _SEAT_HELD
+    ))
+    
+    return list(db.execute(stmt).scalars())
+
+
+def get_booked_seats_set(db: Session, flight_id: str) -> FrozenSet[str]:
+    """Get booked seat numbers for a flight as a set, for membership checks."""
+    return frozenset(get_booked_seats(db, flight_id))
+
+
+def get_seat_availability(db: Session, flight: Flight) -> Tuple[List[str], List[str]]:
+    """
+    Get a flight's open seats and its booked seats.
+    
+    Args:
+        db: Database session
+        flight: Flight to check
     
-    return [booking.seat_no for booking in bookings]
+    Returns:
+        (available seat numbers, booked seat numbers), both in seat-map order
+    """
+    # Set of booked seats for O(1) membership checks
+    booked = get_booked_seats_set(db, flight.id)
+    
+    # Walk all possible seats once, splitting them into open and booked
+    available_seats, booked_seats = [], []
+    for seat in _seat_table(flight.total_seats):
+        (booked_seats if seat in booked else available_seats).append(seat)
+    
+    # Bookings outside the seat map (e.g. the unused end of a partial last
+    # row) are still reported, after the mapped ones
+    if len(booked_seats) < len(booked):
+        booked_seats.extend(sorted(booked.difference(booked_seats)))
+    return available_seats, booked_seats
+
+
+def bulk_release_seats(db: Session, releases: Iterable[Tuple[str, int]]) -> None:
+    """
+    Return seats to their flights' availability in a single UPDATE.
+    
+    Args:
+        db: Database session (the caller commits)
+        releases: (flight_id, seat_count) pairs; repeated flights are summed
+    """
+    deltas: Dict[str, int] = {}
+    for flight_id, seat_count in releases:
+        deltas[flight_id] = deltas.get(flight_id, 0) + seat_count
+    
+    if not deltas:
+        return
+    
+    # UPDATE flights SET available_seats = available_seats + CASE id ... END
+    # WHERE id IN (...); loaded Flight objects are not refreshed
+    db.execute(
+        update(Flight).where(Flight.id.in_(list(deltas))).values(
+            available_seats=Flight.available_seats + case(
+                *[(Flight.id == flight_id, seat_count) for flight_id, seat_count in deltas.items()]
+            )
+        ).execution_options(synchronize_session=False)
+    )
 
 
 def generate_seat_numbers(total_seats: int) -> List[str]:
@@ -139,16 +233,19 @@ def generate_seat_numbers(total_seats: int) -> List[str]:
     
     Example: 1A, 1B, 1C, 1D, 1E, 1F, 2A, 2B, ...
     """
-    seats = []
-    columns = ['A', 'B', 'C', 'D', 'E', 'F']  # 6 seats per row
-    rows_needed = (total_seats + 5) // 6  # Ceiling division
-    
-    for row in range(1, rows_needed + 1):
-        for col in columns:
-            if len(seats) < total_seats:
-                seats.append(f"{row}{col}")
-    
-    return seats
+    return list(_seat_table(total_seats))
+
+
+@lru_cache(maxsize=32)
+def _seat_table(total_seats: int) -> Tuple[str, ...]:
+    """
+    Immutable seat numbers for a capacity, built once per distinct seat count.
+    Aircraft capacities are a small fixed set, so the cache stays tiny.
+    """
+    rows_needed = (total_seats + 5) // 6  # Ceiling division, 6 seats per row
+    seats = (f"{row}{col}" for row, col in product(range(1, rows_needed + 1), 'ABCDEF'))
+    # The last row may be partial; slice instead of checking length per seat
+    return tuple(seats)[:total_seats]
 
 
 def get_fare_history(db: Session, flight_id: str) -> List[FareHistoryItem]:
@@ -189,21 +286,42 @@ def record_fare_history(db: Session, flight: Flight) -> None:
     db.commit()
 
 
-def _flight_to_response(flight: Flight) -> FlightResponse:
-    """Convert Flight model to FlightResponse schema."""
-    duration = int((flight.arrival_time - flight.departure_time).total_seconds() / 60)
+def record_fare_history_bulk(db: Session, flights: Sequence[Flight]) -> None:
+    """
+    Record current fares for many flights in one batched INSERT and one commit.
+    Prices are computed in a single vectorized pass.
+    """
+    if not flights:
+        return
     
-    return FlightResponse(
-        id=flight.id,
-        flight_number=flight.flight_number,
-        airline=flight.airline,
-        source=flight.source,
-        destination=flight.destination,
-        departure_time=flight.departure_time,
-        arrival_time=flight.arrival_time,
-        base_price=flight.base_price,
-        dynamic_price=calculate_dynamic_price(flight),
-        total_seats=flight.total_seats,
-        available_seats=flight.available_seats,
-        duration_minutes=duration
-    )
+    prices = calculate_dynamic_prices(flights)
+    db.bulk_insert_mappings(FareHistory, [
+        {
+            "flight_id": flight.id,
+            "price": price,
+            "demand_factor": flight.demand_factor,
+            "available_seats": flight.available_seats
+        }
+        for flight, price in zip(flights, prices)
+    ])
+    db.commit()
+
+
+def _row_to_flight_dict(row, dynamic_price: float) -> dict:
+    """Convert a _FLIGHT_COLS row and its dynamic price to a FlightResponse-shaped dict."""
+    duration = int((row.arrival_time - row.departure_time).total_seconds() / 60)
+    
+    return {
+        "id": row.id,
+        "flight_number": row.flight_number,
+        "airline": row.airline,
+        "source": row.source,
+        "destination": row.destination,
+        "departure_time": row.departure_time,
+        "arrival_time": row.arrival_time,
+        "base_price": row.base_price,
+        "dynamic_price": dynamic_price,
+        "total_seats": row.total_seats,
+        "available_seats": row.available_seats,
+        "duration_minutes": duration
+    }
@@ -9,9 +9,29 @@ Calculates dynamic prices based on:
 """
 
 from datetime import datetime
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+import numpy as np
+
 from app.database.models import Flight
 
 
+# Tier multipliers indexed by bucket (see _seat_bucket / _time_bucket)
+SEAT_FACTORS = (2.0, 1.5, 1.2, 1.0)       # <=20%, 20-50%, 50-80%, >80% available
+TIME_FACTORS = (1.0, 1.5, 1.3, 1.2, 1.0)  # departed, <1 day, 1-3 days, 3-7 days, >7 days
+
+# seat_factor * time_factor for every (seat bucket, time bucket) pair, so a
+# price is one table lookup and base * multiplier * demand
+PRICE_MULTIPLIERS = tuple(
+    tuple(seat_factor * time_factor for time_factor in TIME_FACTORS)
+    for seat_factor in SEAT_FACTORS
+)
+
+# The same table as an array, for lookups in the vectorized path
+_MULTIPLIER_TABLE = np.array(PRICE_MULTIPLIERS)
+
+
 def calculate_seat_factor(flight: Flight) -> float:
     """
     Calculate price factor based on seat availability.
@@ -25,22 +45,19 @@ def calculate_seat_factor(flight: Flight) -> float:
     Returns:
         Seat factor multiplier (1.0 - 2.0)
     """
-    if flight.total_seats == 0:
-        return 1.0
-    
-    availability_percentage = (flight.available_seats / flight.total_seats) * 100
+    return SEAT_FACTORS[_seat_bucket(flight.available_seats, flight.total_seats)]
+
+
+def _seat_bucket(available_seats: int, total_seats: int) -> int:
+    """Seat tier index into SEAT_FACTORS (flights with no seats use the base tier)."""
+    if total_seats == 0:
+        return 3
     
-    if availability_percentage > 80:
-        return 1.0
-    elif availability_percentage > 50:
-        return 1.2
-    elif availability_percentage > 20:
-        return 1.5
-    else:
-        return 2.0
+    availability_percentage = (available_seats / total_seats) * 100
+    return (availability_percentage > 20) + (availability_percentage > 50) + (availability_percentage > 80)
 
 
-def calculate_time_factor(flight: Flight) -> float:
+def calculate_time_factor(flight: Flight, now: Optional[datetime] = None) -> float:
     """
     Calculate price factor based on time until departure.
     
@@ -49,50 +66,140 @@ def calculate_time_factor(flight: Flight) -> float:
     - 3-7 days: 1.2
     - 1-3 days: 1.3
     - <24 hours: 1.5
+    - departed: 1.0
+    
+    Args:
+        flight: Flight object with a departure time
+        now: Reference time (defaults to now)
     
     Returns:
         Time factor multiplier (1.0 - 1.5)
     """
-    now = datetime.now()
-    time_until_departure = flight.departure_time - now
-    days_until = time_until_departure.days
-    hours_until = time_until_departure.total_seconds() / 3600
-    
-    if days_until > 7:
-        return 1.0
-    elif days_until >= 3:
-        return 1.2
-    elif days_until >= 1:
-        return 1.3
-    elif hours_until > 0:
-        return 1.5
-    else:
-        # Flight has departed
-        return 1.0
-
-
-def calculate_dynamic_price(flight: Flight) -> float:
+    now = now or datetime.now()
+    return TIME_FACTORS[_time_bucket((flight.departure_time - now).total_seconds())]
+
+
+def _time_bucket(seconds_until: float) -> int:
+    """Departure tier index into TIME_FACTORS."""
+    days_until = seconds_until // 86400  # Floor, like timedelta.days
+    return (seconds_until > 0) + (days_until >= 1) + (days_until >= 3) + (days_until > 7)
+
+
+def calculate_dynamic_price(flight: Flight, now: Optional[datetime] = None) -> float:
     """
     Calculate the final dynamic price for a flight.
     
-    Formula: base_price * seat_factor * time_factor * demand_factor
+    Formula: base_price * (seat_factor * time_factor) * demand_factor, with
+    the bracketed product read from PRICE_MULTIPLIERS
     
     Args:
         flight: Flight object with pricing data
+        now: Reference time for the departure tier (defaults to now)
     
     Returns:
         Dynamic price rounded to 2 decimal places
     """
-    seat_factor = calculate_seat_factor(flight)
-    time_factor = calculate_time_factor(flight)
-    demand_factor = flight.demand_factor  # From simulated demand engine
-    
-    dynamic_price = flight.base_price * seat_factor * time_factor * demand_factor
+    now = now or datetime.now()
+    seconds_until = (flight.departure_time - now).total_seconds()
+    return _priced(
+        flight.base_price,
+        flight.demand_factor,  # From simulated demand engine
+        _seat_bucket(flight.available_seats, flight.total_seats),
+        _time_bucket(seconds_until)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _priced(base_price: float, demand_factor: float, seat_bucket: int, time_bucket: int) -> float:
+    """
+    Final price for quantized pricing inputs, rounded to 2 decimal places.
     
+    The key fully determines the result, so entries never go stale; a
+    flight's price is only recomputed when its tier or demand changes.
+    """
+    dynamic_price = base_price * PRICE_MULTIPLIERS[seat_bucket][time_bucket] * demand_factor
     return round(dynamic_price, 2)
 
 
-def get_pricing_breakdown(flight: Flight) -> dict:
+def calculate_dynamic_prices(flights: Sequence, now: Optional[datetime] = None) -> List[float]:
+    """
+    Calculate dynamic prices for many flights at once.
+    
+    Same tiers and formula as calculate_dynamic_price, evaluated as NumPy
+    array expressions instead of one Python call per flight. Accepts Flight
+    objects or rows exposing the same attributes.
+    
+    Args:
+        flights: Flights (or rows) with pricing data
+        now: Reference time for the departure tiers (defaults to now)
+    
+    Returns:
+        Dynamic prices rounded to 2 decimal places, in input order
+    """
+    count = len(flights)
+    if count == 0:
+        return []
+    now = now or datetime.now()
+    
+    base = np.fromiter((f.base_price for f in flights), dtype=np.float64, count=count)
+    available = np.fromiter((f.available_seats for f in flights), dtype=np.float64, count=count)
+    total = np.fromiter((f.total_seats for f in flights), dtype=np.float64, count=count)
+    demand = np.fromiter((f.demand_factor for f in flights), dtype=np.float64, count=count)
+    departures = np.array([f.departure_time for f in flights], dtype="datetime64[us]")
+    seconds_until = (departures - np.datetime64(now, "us")) / np.timedelta64(1, "s")
+    
+    prices = calculate_dynamic_price_array(base, available, total, demand, seconds_until)
+    
+    # Python's round keeps results identical to calculate_dynamic_price
+    return [round(price, 2) for price in prices.tolist()]
+
+
+def calculate_dynamic_price_array(
+    base: np.ndarray,
+    available: np.ndarray,
+    total: np.ndarray,
+    demand: np.ndarray,
+    seconds_until: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized pricing formula over column arrays (one element per flight).
+    
+    Args:
+        base: Base prices
+        available: Available seats
+        total: Total seats
+        demand: Demand factors
+        seconds_until: Seconds until departure (negative once departed)
+    
+    Returns:
+        Unrounded dynamic prices
+    """
+    # Buckets are sums of packed comparisons (same thresholds as _seat_bucket
+    # and _time_bucket), then one multiplier table lookup; no per-row branches
+    
+    # Seat bucket; flights with no seats price at the base tier (as the scalar path)
+    availability_percentage = np.divide(
+        available * 100, total, out=np.full(len(total), 100.0), where=total > 0
+    )
+    seat_bucket = (
+        (availability_percentage > 20).astype(np.intp)
+        + (availability_percentage > 50)
+        + (availability_percentage > 80)
+    )
+    
+    # Time bucket; floor division matches timedelta.days for past departures
+    days_until = np.floor_divide(seconds_until, 86400)
+    time_bucket = (
+        (seconds_until > 0).astype(np.intp)
+        + (days_until >= 1)
+        + (days_until >= 3)
+        + (days_until > 7)
+    )
+    
+    return base * _MULTIPLIER_TABLE[seat_bucket, time_bucket] * demand
+
+
+def get_pricing_breakdown(flight: Flight, now: Optional[datetime] = None) -> dict:
     """
     Get detailed breakdown of price calculation.
     Useful for transparency and debugging.
@@ -100,16 +207,23 @@ def get_pricing_breakdown(flight: Flight) -> dict:
     Returns:
         Dictionary with all pricing factors and final price
     """
-    seat_factor = calculate_seat_factor(flight)
-    time_factor = calculate_time_factor(flight)
+    now = now or datetime.now()
+    seat_bucket = _seat_bucket(flight.available_seats, flight.total_seats)
+    time_bucket = _time_bucket((flight.departure_time - now).total_seconds())
+    seat_factor = SEAT_FACTORS[seat_bucket]
+    time_factor = TIME_FACTORS[time_bucket]
     demand_factor = flight.demand_factor
     
+    # Same buckets and multiplier table as calculate_dynamic_price, so the
+    # breakdown always agrees with the quoted price
+    final_price = _priced(flight.base_price, demand_factor, seat_bucket, time_bucket)
+    
     return {
         "base_price": flight.base_price,
         "seat_factor": seat_factor,
         "time_factor": time_factor,
         "demand_factor": demand_factor,
-        "final_price": calculate_dynamic_price(flight),
+        "final_price": final_price,
         "factors_applied": {
             "seats_available": flight.available_seats,
             "total_seats": flight.total_seats,
@@ -8,7 +8,14 @@ from fastapi import HTTPException, status
 
 from app.database.models import User
 from app.schemas.user import UserCreate, UserResponse, TokenResponse
-from app.utils.auth import hash_password, verify_password, create_access_token
+from app.utils.auth import (
+    hash_password, verify_password, password_needs_rehash, create_access_token,
+    get_cached_user, invalidate_user
+)
+
+# A hash at the configured cost, used to equalize unknown-email timing. Built
+# at import so the first unknown-email login does not pay for two bcrypt runs.
+_DUMMY_PASSWORD_HASH = hash_password("unknown-user-placeholder")
 
 
 def create_user(db: Session, user_data: UserCreate) -> User:
@@ -63,22 +70,37 @@ def authenticate_user(db: Session, email: str, password: str) -> TokenResponse:
     Raises:
         HTTPException: If credentials are invalid
     """
+    invalid_credentials = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Incorrect email or password"
+    )
+    
     # Find user by email
     user = db.query(User).filter(User.email == email).first()
     
-    if not user or not verify_password(password, user.password_hash):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password"
-        )
+    if not user:
+        # Spend the same bcrypt work as a real check so unknown emails
+        # cannot be told apart by response time
+        verify_password(password, _DUMMY_PASSWORD_HASH)
+        raise invalid_credentials
+    
+    if not verify_password(password, user.password_hash):
+        raise invalid_credentials
+    
+    # Upgrade hashes made with a different cost factor while the plain password is at hand
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = hash_password(password)
+        db.commit()
+        invalidate_user(user.id)
     
     # Create access token
     access_token = create_access_token(data={"sub": user.id})
     
-    return TokenResponse(
+    # Built from trusted server-side data, so skip validation
+    return TokenResponse.model_construct(
         access_token=access_token,
         token_type="bearer",
-        user=UserResponse(
+        user=UserResponse.model_construct(
             id=user.id,
             name=user.name,
             email=user.email,
@@ -100,7 +122,7 @@ def get_user_by_id(db: Session, user_id: str) -> Optional[User]:
     Returns:
         User object or None if not found
     """
-    return db.query(User).filter(User.id == user_id).first()
+    return get_cached_user(db, user_id)
 
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
@@ -5,14 +5,21 @@ This task runs periodically to adjust demand factors for flights,
 simulating real-world price changes based on demand.
 """
 
-import random
 import asyncio
 from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.database.connection import SessionLocal
 from app.database.models import Flight, FareHistory
-from app.services.pricing_engine import calculate_dynamic_price
+from app.services.pricing_engine import calculate_dynamic_price_array
+
+# Simulator-owned generator (seeded from OS entropy), separate from the
+# global random state
+_rng = np.random.default_rng()
 
 
 async def simulate_demand_changes():
@@ -25,9 +32,9 @@ async def simulate_demand_changes():
     """
     while True:
         try:
-            db = SessionLocal()
-            update_demand_factors(db)
-            db.close()
+            # Blocking database work runs in a worker thread so requests keep
+            # being served on the event loop during a tick
+            await asyncio.to_thread(run_single_update)
         except Exception as e:
             print(f"Demand simulator error: {e}")
         
@@ -43,47 +50,105 @@ def update_demand_factors(db: Session):
     - Flights departing soon get higher demand
     - Random fluctuations of ±10%
     - Demand factor bounds: 0.8 to 1.5
+    
+    All flights are processed in one vectorized NumPy pass; changed flights
+    are written with one bulk UPDATE and one bulk fare-history INSERT.
     """
-    flights = db.query(Flight).filter(
-        Flight.departure_time > datetime.now()
+    now = datetime.now()
+    # Core select of just the pricing columns: plain row tuples, no Query
+    # wrapper or ORM entities
+    flights = db.execute(
+        select(
+            Flight.id,
+            Flight.departure_time,
+            Flight.demand_factor,
+            Flight.base_price,
+            Flight.available_seats,
+            Flight.total_seats
+        ).where(Flight.departure_time > now)
     ).all()
     
-    for flight in flights:
-        # Calculate time-based demand adjustment
-        hours_until_departure = (flight.departure_time - datetime.now()).total_seconds() / 3600
+    count = len(flights)
+    if count:
+        ids, departures, demand, base, available, total = zip(*flights)
+        ids = np.array(ids, dtype=object)
+        demand = np.array(demand, dtype=np.float64)
+        base = np.array(base, dtype=np.float64)
+        available = np.array(available, dtype=np.int64)
+        total = np.array(total, dtype=np.int64)
+        departures = np.array(departures, dtype="datetime64[us]")
+        seconds_until = (departures - np.datetime64(now, "us")) / np.timedelta64(1, "s")
+        hours_until_departure = seconds_until / 3600
         
-        if hours_until_departure < 24:
-            # High demand for last-minute flights
-            base_adjustment = random.uniform(0.05, 0.15)
-        elif hours_until_departure < 72:
-            # Moderate demand
-            base_adjustment = random.uniform(-0.05, 0.10)
-        else:
-            # Normal fluctuations
-            base_adjustment = random.uniform(-0.10, 0.10)
+        # Time-based demand adjustment: high for last-minute flights (<24h),
+        # moderate within 72h, normal fluctuations otherwise
+        last_minute = hours_until_departure < 24
+        within_three_days = hours_until_departure < 72
+        lows = np.select([last_minute, within_three_days], [0.05, -0.05], -0.10)
+        highs = np.select([last_minute, within_three_days], [0.15, 0.10], 0.10)
         
-        # Apply adjustment
-        new_demand_factor = flight.demand_factor + base_adjustment
+        # One draw per flight from its own range, in a single call
+        base_adjustment = _rng.uniform(lows, highs)
         
-        # Clamp to valid range
-        new_demand_factor = max(0.8, min(1.5, new_demand_factor))
-        new_demand_factor = round(new_demand_factor, 2)
+        # Apply adjustment, clamp to valid range
+        new_demand = np.clip(demand + base_adjustment, 0.8, 1.5).round(2)
         
         # Update only if there's a change
-        if abs(new_demand_factor - flight.demand_factor) > 0.01:
-            flight.demand_factor = new_demand_factor
+        changed = np.abs(new_demand - demand) > 0.01
+        if changed.any():
+            changed_ids = ids[changed].tolist()
+            changed_demand = new_demand[changed].tolist()
+            changed_available = available[changed].tolist()
+            prices = calculate_dynamic_price_array(
+                base[changed],
+                available[changed],
+                total[changed],
+                new_demand[changed],
+                seconds_until[changed]
+            ).tolist()
+            
+            db.bulk_update_mappings(Flight, [
+                {"id": flight_id, "demand_factor": demand_factor}
+                for flight_id, demand_factor in zip(changed_ids, changed_demand)
+            ])
             
-            # Record in fare history
-            history = FareHistory(
-                flight_id=flight.id,
-                price=calculate_dynamic_price(flight),
-                demand_factor=flight.demand_factor,
-                available_seats=flight.available_seats
-            )
-            db.add(history)
+            # Record in fare history, skipping flights whose rounded price
+            # is still the last one recorded (the demand change was noise)
+            last_prices = _last_recorded_prices(db, changed_ids)
+            history = []
+            for flight_id, price, demand_factor, seats in zip(
+                changed_ids, prices, changed_demand, changed_available
+            ):
+                price = round(price, 2)
+                if last_prices.get(flight_id) != price:
+                    history.append({
+                        "flight_id": flight_id,
+                        "price": price,
+                        "demand_factor": demand_factor,
+                        "available_seats": seats
+                    })
+            
+            if history:
+                db.bulk_insert_mappings(FareHistory, history)
     
     db.commit()
-    print(f"[Demand Simulator] Updated {len(flights)} flights at {datetime.now()}")
+    print(f"[Demand Simulator] Updated {count} flights at {now}")
+
+
+def _last_recorded_prices(db: Session, flight_ids: List[str]) -> Dict[str, float]:
+    """Most recent fare-history price per flight, in one query."""
+    newest_first = func.row_number().over(
+        partition_by=FareHistory.flight_id,
+        order_by=(FareHistory.recorded_at.desc(), FareHistory.id.desc())
+    ).label("rank")
+    ranked = select(
+        FareHistory.flight_id, FareHistory.price, newest_first
+    ).where(FareHistory.flight_id.in_(flight_ids)).subquery()
+    
+    rows = db.execute(
+        select(ranked.c.flight_id, ranked.c.price).where(ranked.c.rank == 1)
+    )
+    return {flight_id: price for flight_id, price in rows}
 
 
 def run_single_update():
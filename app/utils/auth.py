@@ -3,31 +3,47 @@ Authentication utilities for the Flight Booking App.
 Handles JWT token generation/validation and password hashing.
 """
 
+import os
 from datetime import datetime, timedelta
+from threading import Lock
 from typing import Optional
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 import bcrypt
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.database.connection import get_db
 from app.database.models import User
 
-# Security configuration
-SECRET_KEY = "your-super-secret-key-change-in-production"  # TODO: Use environment variable
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
+# Security configuration (set SECRET_KEY in production)
+SECRET_KEY = os.getenv("SECRET_KEY", "your-super-secret-key-change-in-production")
+ALGORITHM = os.getenv("ALGORITHM", "HS256")
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", str(60 * 24)))  # 24 hours
+
+# bcrypt cost factor; each step doubles hashing time (library default is 12)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
+# Column values of recently resolved users, keyed by id. Every authenticated
+# request resolves its token subject through get_cached_user, and user rows
+# rarely change; anything that modifies a user calls invalidate_user.
+# The cache is per process: invalidate_user only clears the calling worker,
+# so other workers can serve a changed user for up to this TTL. Admin checks
+# re-read is_admin from the database (see require_admin) for that reason.
+USER_CACHE_TTL_SECONDS = 60
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+_user_cache_lock = Lock()
+
 
 def hash_password(password: str) -> str:
     """Hash a plain password using bcrypt."""
     # Truncate password to 72 bytes (bcrypt limit) and encode
     password_bytes = password.encode('utf-8')[:72]
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
@@ -39,6 +55,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password_bytes, hashed_bytes)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a bcrypt hash ($2b$<cost>$...) uses a cost other than BCRYPT_ROUNDS."""
+    try:
+        return int(hashed_password.split('$')[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
@@ -111,13 +135,49 @@ def get_current_user(
     if user_id is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_cached_user(db, user_id)
     if user is None:
         raise credentials_exception
     
     return user
 
 
+def get_cached_user(db: Session, user_id: str) -> Optional[User]:
+    """
+    Get a user by ID, served from the per-process user cache when possible.
+    
+    Args:
+        db: Database session
+        user_id: User's ID
+    
+    Returns:
+        User object attached to db, or None if not found
+    """
+    with _user_cache_lock:
+        cached = _user_cache.get(user_id)
+    
+    if cached is not None:
+        # Attach a copy to this session without a SELECT; merge(load=False)
+        # needs a detached object with no pending changes
+        user = User(**cached)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+    
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is not None:
+        values = {attr.key: getattr(user, attr.key) for attr in User.__mapper__.column_attrs}
+        with _user_cache_lock:
+            _user_cache[user_id] = values
+    
+    return user
+
+
+def invalidate_user(user_id: str) -> None:
+    """Drop a user's cached row after it is modified (this process only)."""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
 def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: Session = Depends(get_db)
@@ -0,0 +1,72 @@
+"""
+Keyset (cursor) pagination helpers for list endpoints.
+
+A cursor encodes the sort value and id of the last row of a page; the next
+page continues strictly after that row, so every page is a bounded index
+range scan regardless of table size. The cursor for the following page is
+returned in the X-Next-Cursor response header, keeping list bodies unchanged.
+"""
+
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(sort_value: datetime, row_id: str) -> str:
+    """Encode the position of a row as an opaque cursor string."""
+    return f"{sort_value.isoformat()}|{row_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        sort_value, row_id = cursor.rsplit("|", 1)
+        return datetime.fromisoformat(sort_value), row_id
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def paginate_desc(query: Query, sort_column, id_column, cursor: Optional[str], limit: int) -> Query:
+    """
+    Order a query newest-first and restrict it to the page after the cursor.
+
+    The id column breaks ties between equal sort values. One extra row is
+    fetched so finish_page can tell whether another page exists.
+    """
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, id_column < row_id)
+            )
+        )
+    return query.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+def finish_page(
+    rows: List,
+    limit: int,
+    response: Response,
+    cursor_key: Callable[[object], Tuple[datetime, str]]
+) -> List:
+    """Trim the look-ahead row and publish the next cursor when more rows exist."""
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*cursor_key(rows[-1]))
+    return rows
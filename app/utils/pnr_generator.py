@@ -5,40 +5,27 @@ Generates unique 6-character alphanumeric codes for confirmed bookings.
 
 import random
 import string
-from sqlalchemy.orm import Session
 
-from app.database.models import Booking
+# OS-entropy backed generator: no shared seeded state, unpredictable codes
+_system_random = random.SystemRandom()
+_PNR_CHARACTERS = string.ascii_uppercase + string.digits
 
 
-def generate_pnr(db: Session) -> str:
+def generate_pnr() -> str:
     """
-    Generate a unique 6-character alphanumeric PNR.
+    Generate a random 6-character alphanumeric PNR.
     
     The PNR format is: 6 uppercase letters/digits
     Example: A1B2C3, XYZ789, etc.
     
-    Args:
-        db: Database session to check for uniqueness
+    Uniqueness is not checked here: the bookings.pnr column is UNIQUE, and
+    callers retry with a fresh code if the insert/update hits a collision
+    (about 1 in 2 billion per existing booking).
     
     Returns:
-        Unique PNR string
+        PNR string
     """
-    characters = string.ascii_uppercase + string.digits
-    max_attempts = 100  # Prevent infinite loop
-    
-    for _ in range(max_attempts):
-        # Generate random 6-character code
-        pnr = ''.join(random.choices(characters, k=6))
-        
-        # Check if PNR already exists
-        existing = db.query(Booking).filter(Booking.pnr == pnr).first()
-        if not existing:
-            return pnr
-    
-    # Fallback: Use timestamp-based PNR if random generation fails
-    import time
-    timestamp = str(int(time.time()))[-6:]
-    return f"T{timestamp[-5:]}"
+    return ''.join(_system_random.choices(_PNR_CHARACTERS, k=6))
 
 
 def format_pnr(pnr: str) -> str:
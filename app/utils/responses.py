@@ -0,0 +1,21 @@
+"""
+Response classes for the Flight Booking App.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    orjson encodes datetimes, floats, UUIDs, enums and numpy values natively, so handlers
+    that already hold plain dicts can return this directly and skip
+    FastAPI's jsonable_encoder and response-model revalidation.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
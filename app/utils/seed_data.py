@@ -21,6 +21,12 @@ CITIES = [
     "Hyderabad", "Ahmedabad", "Pune", "Jaipur", "Lucknow"
 ]
 
+# Destination choices for each source city (every city but itself)
+_OTHER_CITIES = {city: tuple(c for c in CITIES if c != city) for city in CITIES}
+
+# Fixed seed so every fresh database gets the same sample schedule
+SAMPLE_DATA_SEED = 42
+
 FLIGHT_PREFIXES = {
     "IndiGo": "6E",
     "Air India": "AI",
@@ -78,67 +84,71 @@ def generate_sample_flights(db: Session, num_flights: int = 50) -> list:
         num_flights: Number of flights to generate
     
     Returns:
-        List of created Flight objects
+        List of inserted flight rows (as dicts)
     """
     # First, ensure admin user exists
     create_admin_user(db)
     
-    flights = []
-    
-    # Check if flights already exist
-    existing_count = db.query(Flight).count()
-    if existing_count > 0:
-        print(f"Database already has {existing_count} flights. Skipping seed.")
+    # Check if flights already exist (first row only, no full count)
+    if db.query(Flight.id).first() is not None:
+        print("Database already has flights. Skipping seed.")
         return []
     
+    # One reference time for every generated departure
+    now = datetime.now()
+    
+    # Dedicated RNG: reproducible, and independent of the global random state
+    rng = random.Random(SAMPLE_DATA_SEED)
+    
+    # Plain dicts instead of Flight objects: bulk_insert_mappings skips the
+    # unit of work and sends the whole batch as one executemany INSERT
+    flights = []
     for i in range(num_flights):
         # Random source and destination (different cities)
-        source = random.choice(CITIES)
-        destination = random.choice([c for c in CITIES if c != source])
+        source = rng.choice(CITIES)
+        destination = rng.choice(_OTHER_CITIES[source])
         
         # Random airline
-        airline = random.choice(AIRLINES)
+        airline = rng.choice(AIRLINES)
         
         # Random departure time in the next 30 days
-        days_ahead = random.randint(1, 30)
-        hours = random.randint(6, 22)  # Flights between 6 AM and 10 PM
-        minutes = random.choice([0, 15, 30, 45])
-        departure = datetime.now().replace(
+        days_ahead = rng.randint(1, 30)
+        hours = rng.randint(6, 22)  # Flights between 6 AM and 10 PM
+        minutes = rng.choice([0, 15, 30, 45])
+        departure = now.replace(
             hour=hours, minute=minutes, second=0, microsecond=0
         ) + timedelta(days=days_ahead)
         
         # Flight duration: 1-4 hours
-        duration_hours = random.uniform(1, 4)
+        duration_hours = rng.uniform(1, 4)
         arrival = departure + timedelta(hours=duration_hours)
         
         # Base price: ₹2000 - ₹15000
-        base_price = random.randint(2000, 15000)
+        base_price = rng.randint(2000, 15000)
         
         # Total seats: 150-200
-        total_seats = random.choice([150, 160, 170, 180, 190, 200])
+        total_seats = rng.choice([150, 160, 170, 180, 190, 200])
         
         # Available seats: 50-100% of total
-        available_seats = random.randint(int(total_seats * 0.5), total_seats)
+        available_seats = rng.randint(int(total_seats * 0.5), total_seats)
         
         # Initial demand factor: 0.9 - 1.1
-        demand_factor = round(random.uniform(0.9, 1.1), 2)
-        
-        flight = Flight(
-            flight_number=generate_flight_number(airline, i),
-            airline=airline,
-            source=source,
-            destination=destination,
-            departure_time=departure,
-            arrival_time=arrival,
-            base_price=base_price,
-            total_seats=total_seats,
-            available_seats=available_seats,
-            demand_factor=demand_factor
-        )
+        demand_factor = round(rng.uniform(0.9, 1.1), 2)
         
-        db.add(flight)
-        flights.append(flight)
+        flights.append({
+            "flight_number": generate_flight_number(airline, i),
+            "airline": airline,
+            "source": source,
+            "destination": destination,
+            "departure_time": departure,
+            "arrival_time": arrival,
+            "base_price": base_price,
+            "total_seats": total_seats,
+            "available_seats": available_seats,
+            "demand_factor": demand_factor
+        })
     
+    db.bulk_insert_mappings(Flight, flights)
     db.commit()
     print(f"Successfully created {len(flights)} sample flights.")
     return flights
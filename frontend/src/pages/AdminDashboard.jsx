@@ -19,6 +19,9 @@ const AdminDashboard = () => {
     const [bookings, setBookings] = useState([]);
     const [users, setUsers] = useState([]);
     const [flights, setFlights] = useState([]);
+    // Cursor for each list's next page (null once everything is loaded)
+    const [nextCursors, setNextCursors] = useState({ bookings: null, users: null, flights: null });
+    const [loadingMore, setLoadingMore] = useState(false);
     const [refreshing, setRefreshing] = useState(false);
 
     useEffect(() => {
@@ -51,33 +54,57 @@ const AdminDashboard = () => {
         }
     };
 
-    const fetchBookings = async () => {
+    // Loads the first page of a list, or appends the next one when a cursor is given
+    const fetchPage = async (list, request, setRows, cursor) => {
+        const response = await request(cursor);
+        setRows((rows) => (cursor ? [...rows, ...response.data] : response.data));
+        setNextCursors((cursors) => ({ ...cursors, [list]: response.headers['x-next-cursor'] || null }));
+    };
+
+    const fetchBookings = async (cursor) => {
         try {
-            const response = await adminAPI.getAllBookings();
-            setBookings(response.data);
+            await fetchPage('bookings', (c) => adminAPI.getAllBookings(undefined, c), setBookings, cursor);
         } catch (error) {
             toast.error('Failed to load bookings');
         }
     };
 
-    const fetchUsers = async () => {
+    const fetchUsers = async (cursor) => {
         try {
-            const response = await adminAPI.getUsers();
-            setUsers(response.data);
+            await fetchPage('users', adminAPI.getUsers, setUsers, cursor);
         } catch (error) {
             toast.error('Failed to load users');
         }
     };
 
-    const fetchFlights = async () => {
+    const fetchFlights = async (cursor) => {
         try {
-            const response = await adminAPI.getFlights();
-            setFlights(response.data);
+            await fetchPage('flights', adminAPI.getFlights, setFlights, cursor);
         } catch (error) {
             toast.error('Failed to load flights');
         }
     };
 
+    const handleLoadMore = async (list) => {
+        const fetchers = { bookings: fetchBookings, users: fetchUsers, flights: fetchFlights };
+        setLoadingMore(true);
+        await fetchers[list](nextCursors[list]);
+        setLoadingMore(false);
+    };
+
+    const renderLoadMore = (list) => nextCursors[list] && (
+        <div className="flex justify-center p-4 border-t border-white/10">
+            <button
+                onClick={() => handleLoadMore(list)}
+                disabled={loadingMore}
+                className="bg-white/10 text-white px-4 py-2 rounded-xl flex items-center gap-2 hover:bg-white/20 transition-all disabled:opacity-50"
+            >
+                {loadingMore && <Loader2 className="h-4 w-4 animate-spin" />}
+                Load more
+            </button>
+        </div>
+    );
+
     const handleRefresh = async () => {
         setRefreshing(true);
         await fetchStats();
@@ -326,6 +353,7 @@ const AdminDashboard = () => {
                             </tbody>
                         </table>
                     </div>
+                    {renderLoadMore('bookings')}
                 </div>
             )}
 
@@ -361,6 +389,7 @@ const AdminDashboard = () => {
                             </tbody>
                         </table>
                     </div>
+                    {renderLoadMore('flights')}
                 </div>
             )}
 
@@ -404,6 +433,7 @@ const AdminDashboard = () => {
                             </tbody>
                         </table>
                     </div>
+                    {renderLoadMore('users')}
                 </div>
             )}
         </div>
@@ -1,13 +1,19 @@
 import { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { flightAPI } from '../services/api';
-import { Search, Plane, MapPin, Calendar, Clock, IndianRupee, ArrowRight } from 'lucide-react';
+import { Search, Plane, MapPin, Calendar, Clock, IndianRupee, ArrowRight, Loader2 } from 'lucide-react';
 import LoadingSpinner from '../components/LoadingSpinner';
 import toast from 'react-hot-toast';
 
+// Flights requested per page (the API caps limit at 200)
+const PAGE_SIZE = 50;
+
 const FlightSearch = () => {
     const [flights, setFlights] = useState([]);
+    const [totalCount, setTotalCount] = useState(0);
+    const [searchParams, setSearchParams] = useState({});
     const [loading, setLoading] = useState(true);
+    const [loadingMore, setLoadingMore] = useState(false);
     const [filters, setFilters] = useState({
         source: '',
         destination: '',
@@ -22,8 +28,10 @@ const FlightSearch = () => {
     const fetchFlights = async (params = {}) => {
         setLoading(true);
         try {
-            const response = await flightAPI.searchFlights(params);
+            const response = await flightAPI.searchFlights({ ...params, limit: PAGE_SIZE, offset: 0 });
             setFlights(response.data.flights);
+            setTotalCount(response.data.total_count);
+            setSearchParams(params);
         } catch (error) {
             toast.error('Failed to fetch flights');
         } finally {
@@ -31,6 +39,24 @@ const FlightSearch = () => {
         }
     };
 
+    // Append the next page of the current search
+    const loadMoreFlights = async () => {
+        setLoadingMore(true);
+        try {
+            const response = await flightAPI.searchFlights({
+                ...searchParams,
+                limit: PAGE_SIZE,
+                offset: flights.length,
+            });
+            setFlights([...flights, ...response.data.flights]);
+            setTotalCount(response.data.total_count);
+        } catch (error) {
+            toast.error('Failed to fetch flights');
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     const handleSearch = (e) => {
         e.preventDefault();
         const params = {};
@@ -140,13 +166,13 @@ const FlightSearch = () => {
                 </div>
             ) : (
                 <div className="space-y-4">
-                    <p className="text-white/50 font-medium">{flights.length} flights found</p>
+                    <p className="text-white/50 font-medium">{totalCount} flights found</p>
 
                     {flights.map((flight, index) => (
                         <div
                             key={flight.id}
                             className="glass-card rounded-2xl p-6 hover:border-indigo-500/30 transition-all group animate-fade-in-up cursor-pointer"
-                            style={{ animationDelay: `${index * 0.1}s` }}
+                            style={{ animationDelay: `${(index % PAGE_SIZE) * 0.1}s` }}
                             onClick={() => navigate(`/flights/${flight.id}`)}
                         >
                             <div className="flex flex-col lg:flex-row lg:items-center justify-between gap-6">
@@ -220,6 +246,19 @@ const FlightSearch = () => {
                             </div>
                         </div>
                     ))}
+
+                    {flights.length < totalCount && (
+                        <div className="flex justify-center pt-4">
+                            <button
+                                onClick={loadMoreFlights}
+                                disabled={loadingMore}
+                                className="btn-premium text-white px-6 py-3 rounded-xl font-semibold flex items-center gap-3 disabled:opacity-50"
+                            >
+                                {loadingMore && <Loader2 className="h-5 w-5 animate-spin" />}
+                                Show more flights ({totalCount - flights.length} more)
+                            </button>
+                        </div>
+                    )}
                 </div>
             )}
         </div>
@@ -45,13 +45,15 @@ export const bookingAPI = {
 };
 
 // Admin API
+// List endpoints are paged; the next page's cursor comes back in the
+// X-Next-Cursor response header (absent on the last page)
 export const adminAPI = {
     getStats: () => api.get('/admin/stats'),
-    getUsers: () => api.get('/admin/users'),
+    getUsers: (cursor) => api.get('/admin/users', { params: { cursor } }),
     toggleUserAdmin: (userId) => api.put(`/admin/users/${userId}/toggle-admin`),
-    getAllBookings: (statusFilter) => api.get('/admin/bookings', { params: { status_filter: statusFilter } }),
+    getAllBookings: (statusFilter, cursor) => api.get('/admin/bookings', { params: { status_filter: statusFilter, cursor } }),
     updateBookingStatus: (bookingId, status) => api.put(`/admin/bookings/${bookingId}/status`, { status }),
-    getFlights: () => api.get('/admin/flights'),
+    getFlights: (cursor) => api.get('/admin/flights', { params: { cursor } }),
     createFlight: (data) => api.post('/admin/flights', data),
     updateFlight: (flightId, data) => api.put(`/admin/flights/${flightId}`, data),
     deleteFlight: (flightId) => api.delete(`/admin/flights/${flightId}`),
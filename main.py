@@ -22,6 +22,17 @@ from app.database.connection import init_db, SessionLocal
 from app.routes import user_routes, flight_routes, booking_routes, admin_routes
 from app.utils.seed_data import generate_sample_flights
 from app.tasks.demand_simulator import simulate_demand_changes
+from app.utils.responses import ORJSONResponse
+from app.utils.pagination import NEXT_CURSOR_HEADER
+
+
+def seed_database():
+    """Seed sample data in its own session (runs in a worker thread)."""
+    db = SessionLocal()
+    try:
+        generate_sample_flights(db, num_flights=50)
+    finally:
+        db.close()
 
 
 @asynccontextmanager
@@ -32,16 +43,15 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting Flight Booking App...")
     
+    # Schema creation and seeding are blocking database work; run them in a
+    # worker thread so the event loop stays free during startup
+    
     # Initialize database
-    init_db()
+    await asyncio.to_thread(init_db)
     print("✅ Database initialized")
     
     # Seed sample data
-    db = SessionLocal()
-    try:
-        generate_sample_flights(db, num_flights=50)
-    finally:
-        db.close()
+    await asyncio.to_thread(seed_database)
     
     # Start background demand simulator (optional)
     # Uncomment to enable automatic demand changes
@@ -83,6 +93,7 @@ A comprehensive flight booking simulator built with FastAPI.
 Most endpoints require a Bearer token. Get one via `/api/users/login`.
     """,
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -100,7 +111,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
     allow_headers=["*"],
-    expose_headers=["*"],
+    # Listed explicitly: browsers ignore the "*" wildcard on credentialed
+    # requests, and the admin dashboard pages with X-Next-Cursor
+    expose_headers=["*", NEXT_CURSOR_HEADER],
 )
 
 # Register routers
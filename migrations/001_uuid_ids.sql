@@ -0,0 +1,37 @@
+-- Convert id and foreign key columns from VARCHAR to native UUID (PostgreSQL).
+--
+-- Databases created before ids were stored as uuid keep VARCHAR columns, since
+-- create_all() never alters existing tables. Run once, before starting the new
+-- application version:
+--
+--     psql "$DATABASE_URL" -f migrations/001_uuid_ids.sql
+--
+-- Every existing id must be a valid UUID string (all ids were generated with
+-- uuid4, so they are). The foreign keys are dropped and re-added because a
+-- referenced column cannot change type while a constraint points at it.
+
+BEGIN;
+
+ALTER TABLE bookings DROP CONSTRAINT IF EXISTS bookings_user_id_fkey;
+ALTER TABLE bookings DROP CONSTRAINT IF EXISTS bookings_flight_id_fkey;
+ALTER TABLE fare_history DROP CONSTRAINT IF EXISTS fare_history_flight_id_fkey;
+
+ALTER TABLE users ALTER COLUMN id TYPE uuid USING id::uuid;
+ALTER TABLE flights ALTER COLUMN id TYPE uuid USING id::uuid;
+ALTER TABLE bookings ALTER COLUMN id TYPE uuid USING id::uuid;
+ALTER TABLE bookings ALTER COLUMN user_id TYPE uuid USING user_id::uuid;
+ALTER TABLE bookings ALTER COLUMN flight_id TYPE uuid USING flight_id::uuid;
+ALTER TABLE fare_history ALTER COLUMN flight_id TYPE uuid USING flight_id::uuid;
+
+ALTER TABLE bookings
+    ADD CONSTRAINT bookings_user_id_fkey FOREIGN KEY (user_id) REFERENCES users (id);
+ALTER TABLE bookings
+    ADD CONSTRAINT bookings_flight_id_fkey FOREIGN KEY (flight_id) REFERENCES flights (id);
+ALTER TABLE fare_history
+    ADD CONSTRAINT fare_history_flight_id_fkey FOREIGN KEY (flight_id) REFERENCES flights (id);
+
+-- Price history is read per flight, newest first
+CREATE INDEX IF NOT EXISTS ix_fare_history_flight_recorded
+    ON fare_history (flight_id, recorded_at);
+
+COMMIT;
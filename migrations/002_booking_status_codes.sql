@@ -0,0 +1,52 @@
+-- Convert bookings.status from VARCHAR names to SMALLINT codes (PostgreSQL).
+--
+-- The codes match BOOKING_STATUS_CODES in app/database/models.py:
+--   PENDING = 1, INFO_ADDED = 2, CONFIRMED = 3, CANCELLED = 4, FAILED = 5
+--
+-- Run once, after 001_uuid_ids.sql and before starting the new application
+-- version:
+--
+--     psql "$DATABASE_URL" -f migrations/002_booking_status_codes.sql
+--
+-- The unique ix_active_seat index fails to build if a seat already has more
+-- than one live booking. List such seats first with:
+--
+--     SELECT flight_id, seat_no, count(*) FROM bookings
+--     WHERE status NOT IN ('CANCELLED', 'FAILED')
+--     GROUP BY flight_id, seat_no HAVING count(*) > 1;
+
+BEGIN;
+
+-- Indexes on status are rebuilt below; drop any created against the old type
+DROP INDEX IF EXISTS ix_booking_status_created;
+DROP INDEX IF EXISTS ix_booking_flight_status;
+DROP INDEX IF EXISTS ix_booking_confirmed;
+DROP INDEX IF EXISTS ix_active_seat;
+
+-- The column used to be nullable, with PENDING applied by the application
+UPDATE bookings SET status = 'PENDING' WHERE status IS NULL;
+
+-- Unknown names map to NULL, which makes SET NOT NULL below abort the migration
+ALTER TABLE bookings ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE bookings ALTER COLUMN status TYPE smallint USING CASE status
+    WHEN 'PENDING' THEN 1
+    WHEN 'INFO_ADDED' THEN 2
+    WHEN 'CONFIRMED' THEN 3
+    WHEN 'CANCELLED' THEN 4
+    WHEN 'FAILED' THEN 5
+END;
+ALTER TABLE bookings ALTER COLUMN status SET NOT NULL;
+
+ALTER TABLE bookings
+    ADD CONSTRAINT ck_booking_status_code CHECK (status IN (1, 2, 3, 4, 5));
+
+-- Admin listings filter by status and order by newest first
+CREATE INDEX ix_booking_status_created ON bookings (status, created_at DESC);
+-- Seat availability checks filter by flight and status
+CREATE INDEX ix_booking_flight_status ON bookings (flight_id, status);
+-- Confirmed bookings per flight
+CREATE INDEX ix_booking_confirmed ON bookings (flight_id) WHERE status = 3;
+-- At most one live (not cancelled or failed) booking per seat
+CREATE UNIQUE INDEX ix_active_seat ON bookings (flight_id, seat_no) WHERE status NOT IN (4, 5);
+
+COMMIT;
@@ -0,0 +1,53 @@
+"""
+Tests that booking responses built without validation match validated ones.
+"""
+
+from datetime import datetime
+
+from app.database.models import Booking, BookingStatus, Flight
+from app.schemas.booking import BookingResponse
+from app.services.booking_service import _booking_to_response
+
+
+def _make_booking(with_flight: bool) -> Booking:
+    booking = Booking(
+        id="0b6f1a52-3c1e-4a8e-9d7e-2f4b5c6d7e8f",
+        pnr="A1B2C3",
+        user_id="5d9e8f7a-1b2c-4d3e-8f9a-0b1c2d3e4f5a",
+        flight_id="9a8b7c6d-5e4f-4a3b-8c2d-1e0f9a8b7c6d",
+        seat_no="12A",
+        passenger_name="John Doe",
+        passenger_email="john@example.com",
+        final_price=5499.5,
+        status=BookingStatus.CONFIRMED,
+        booking_date=datetime(2025, 1, 10, 9, 30),
+        created_at=datetime(2025, 1, 10, 9, 25),
+    )
+    if with_flight:
+        booking.flight = Flight(
+            id=booking.flight_id,
+            flight_number="6E101",
+            airline="IndiGo",
+            source="Delhi",
+            destination="Mumbai",
+            departure_time=datetime(2025, 2, 1, 6, 0),
+            arrival_time=datetime(2025, 2, 1, 8, 15),
+            base_price=4500.0,
+        )
+    return booking
+
+
+def _assert_matches_validated(booking: Booking) -> None:
+    constructed = _booking_to_response(booking)
+    validated = BookingResponse.model_validate(booking, from_attributes=True)
+
+    assert constructed.model_dump() == validated.model_dump()
+    assert constructed.model_dump_json() == validated.model_dump_json()
+
+
+def test_booking_response_with_flight_matches_validated():
+    _assert_matches_validated(_make_booking(with_flight=True))
+
+
+def test_booking_response_without_flight_matches_validated():
+    _assert_matches_validated(_make_booking(with_flight=False))
@@ -0,0 +1,133 @@
+"""
+Tests that every pricing path quotes the same price.
+
+calculate_dynamic_price, calculate_dynamic_prices, calculate_dynamic_price_array
+and get_pricing_breakdown must agree exactly. Against the original per-flight
+tier ladders they may differ by at most one cent: the seat and time factors
+are now pre-multiplied (PRICE_MULTIPLIERS), which changes floating-point
+rounding for about 1 in 2000 prices.
+"""
+
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.services.pricing_engine import (
+    calculate_dynamic_price,
+    calculate_dynamic_price_array,
+    calculate_dynamic_prices,
+    get_pricing_breakdown,
+)
+
+NOW = datetime(2025, 1, 1, 12, 0)
+
+# Largest allowed difference from the original ladder formula
+BASELINE_TOLERANCE = 0.01
+
+# Departure offsets on and around every time tier boundary
+BOUNDARY_OFFSETS = [
+    timedelta(seconds=-1),
+    timedelta(0),
+    timedelta(seconds=1),
+    timedelta(days=1),
+    timedelta(days=1, seconds=-1),
+    timedelta(days=3),
+    timedelta(days=7),
+    timedelta(days=7, seconds=1),
+    timedelta(days=8),
+]
+
+
+def _baseline_price(flight) -> float:
+    """The pricing formula as originally written (tier ladders, left-to-right product)."""
+    if flight.total_seats == 0:
+        seat_factor = 1.0
+    else:
+        availability = (flight.available_seats / flight.total_seats) * 100
+        if availability > 80:
+            seat_factor = 1.0
+        elif availability > 50:
+            seat_factor = 1.2
+        elif availability > 20:
+            seat_factor = 1.5
+        else:
+            seat_factor = 2.0
+
+    time_until = flight.departure_time - NOW
+    days_until = time_until.days
+    hours_until = time_until.total_seconds() / 3600
+    if days_until > 7:
+        time_factor = 1.0
+    elif days_until >= 3:
+        time_factor = 1.2
+    elif days_until >= 1:
+        time_factor = 1.3
+    elif hours_until > 0:
+        time_factor = 1.5
+    else:
+        time_factor = 1.0
+
+    return round(flight.base_price * seat_factor * time_factor * flight.demand_factor, 2)
+
+
+def _random_flights(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    flights = []
+    for _ in range(count):
+        total_seats = rng.choice([0, 5, 6, 150, 180, 200])
+        if rng.random() < 0.3:
+            departure = NOW + rng.choice(BOUNDARY_OFFSETS)
+        else:
+            departure = NOW + timedelta(seconds=rng.uniform(-3 * 86400, 12 * 86400))
+        flights.append(SimpleNamespace(
+            base_price=rng.choice([float(rng.randint(2000, 15000)), rng.uniform(1000, 9000)]),
+            available_seats=rng.randint(0, total_seats),
+            total_seats=total_seats,
+            demand_factor=round(rng.uniform(0.8, 1.5), 2),
+            departure_time=departure,
+        ))
+    return flights
+
+
+@pytest.fixture(scope="module")
+def flights():
+    return _random_flights(20_000)
+
+
+def test_scalar_and_batch_prices_match_exactly(flights):
+    scalar = [calculate_dynamic_price(f, NOW) for f in flights]
+    assert calculate_dynamic_prices(flights, NOW) == scalar
+
+
+def test_array_prices_match_scalar_exactly(flights):
+    seconds_until = np.array([(f.departure_time - NOW).total_seconds() for f in flights])
+    prices = calculate_dynamic_price_array(
+        np.array([f.base_price for f in flights], dtype=np.float64),
+        np.array([f.available_seats for f in flights], dtype=np.float64),
+        np.array([f.total_seats for f in flights], dtype=np.float64),
+        np.array([f.demand_factor for f in flights], dtype=np.float64),
+        seconds_until,
+    )
+    assert [round(p, 2) for p in prices.tolist()] == [calculate_dynamic_price(f, NOW) for f in flights]
+
+
+def test_breakdown_matches_scalar_exactly(flights):
+    for flight in flights:
+        breakdown = get_pricing_breakdown(flight, NOW)
+        assert breakdown["final_price"] == calculate_dynamic_price(flight, NOW)
+        assert breakdown["base_price"] * breakdown["seat_factor"] * breakdown["time_factor"] \
+            * breakdown["demand_factor"] == pytest.approx(breakdown["final_price"], abs=0.01)
+
+
+def test_prices_within_one_cent_of_baseline(flights):
+    for flight in flights:
+        assert calculate_dynamic_price(flight, NOW) == pytest.approx(
+            _baseline_price(flight), abs=BASELINE_TOLERANCE + 1e-9
+        )
+
+
+def test_empty_batch():
+    assert calculate_dynamic_prices([], NOW) == []
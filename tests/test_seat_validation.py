@@ -0,0 +1,37 @@
+"""
+Tests for seat number validation in the booking flow.
+"""
+
+import pytest
+
+from app.services.booking_service import _is_valid_seat
+
+
+@pytest.mark.parametrize("seat_no", ["1A", "1f", "12C", "30F"])
+def test_valid_seats(seat_no):
+    assert _is_valid_seat(seat_no, 180)
+
+
+@pytest.mark.parametrize("seat_no", [
+    "",
+    "A",
+    "01A",        # leading zero
+    "0A",         # row zero
+    "31A",        # past the last row (180 seats = 30 rows)
+    "1G",         # column past F
+    "1@",         # just below 'A'
+    "1\U0010ffff",  # far outside the column range
+    "1 ",
+    "١A",         # Arabic-Indic digit one
+    "¹A",         # superscript one
+    "-1A",
+    "1" * 5000 + "A",  # over-long row
+])
+def test_invalid_seats(seat_no):
+    assert not _is_valid_seat(seat_no, 180)
+
+
+def test_partial_last_row_is_in_range():
+    # 148 seats = 24 full rows + a partial 25th
+    assert _is_valid_seat("25A", 148)
+    assert not _is_valid_seat("26A", 148)